@@ -17,9 +17,15 @@ class Settings(BaseSettings):
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    # Sessions are held in-process, so more than one worker needs sticky routing
+    WORKERS: int = 1
 
     # Ollama Configuration
     OLLAMA_BASE_URL: str = "http://localhost:11434"
+    OLLAMA_KEEP_ALIVE: str = "1h"  # how long Ollama keeps a model loaded after a call
+    WARMUP_ON_START: bool = True  # preload selected models at startup/selection
+    # Worker threads for blocking LLM calls; match OLLAMA_NUM_PARALLEL on the server
+    LLM_POOL_SIZE: int = 4
 
     # Models (will be set via UI selection)
     TEXT_MODEL: str = ""  # Legacy - for backwards compatibility
@@ -31,12 +37,28 @@ class Settings(BaseSettings):
     TEMPERATURE: float = 0.7
     MAX_TOKENS: int = 2048
     TOP_P: float = 0.9
+    # Context window requested from Ollama (its default of 2048 silently truncates);
+    # must fit the prompt scaffold, MAX_INPUT_TOKENS of resume text and MAX_TOKENS output
+    NUM_CTX: int = 12288
+    MAX_INPUT_TOKENS: int = 6000  # resume text beyond this (estimated) is trimmed
 
     # File Upload Settings
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
-    ALLOWED_EXTENSIONS: set = {".pdf", ".docx", ".doc", ".txt"}
+    ALLOWED_EXTENSIONS: frozenset = frozenset({".pdf", ".docx", ".doc", ".txt"})
     UPLOAD_DIR: str = "uploads"
     OUTPUT_DIR: str = "outputs"
+    # Internal caches; must not be inside OUTPUT_DIR, which /api/download serves
+    CACHE_DIR: str = ".cache"
+
+    # Sessions
+    SESSION_TTL: int = 1800  # seconds of inactivity before a session is evicted
+    MAX_SESSIONS: int = 1024
+
+    # LLM response cache: low-temperature (near-deterministic) calls, plus
+    # higher-temperature calls that opt in, such as resume tailoring rewrites
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL: int = 86400  # seconds
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.3
 
     # Resume Processing
     EXTRACT_TIMEOUT: int = 30  # seconds
@@ -51,11 +73,26 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+class ModelState:
+    """Currently selected LLM models, updated at runtime from the UI"""
+
+    __slots__ = ("parsing", "generation")
+
+    def __init__(self, parsing: str = "", generation: str = ""):
+        self.parsing = parsing
+        self.generation = generation
+
+
 settings = Settings()
+model_state = ModelState(
+    parsing=settings.PARSING_MODEL,
+    generation=settings.GENERATION_MODEL,
+)
 
 # Create necessary directories
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 os.makedirs(settings.OUTPUT_DIR, exist_ok=True)
+os.makedirs(settings.CACHE_DIR, exist_ok=True)
 os.makedirs("samples/resumes", exist_ok=True)
 os.makedirs("samples/job_descriptions", exist_ok=True)
 os.makedirs("samples/outputs", exist_ok=True)
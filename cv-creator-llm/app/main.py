@@ -1,36 +1,44 @@
 """
 Main FastAPI application
 """
+import asyncio
+import io
 import logging
 import os
-import shutil
+import re
+import secrets
+import time
+import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from cachetools import TTLCache
+from fastapi import Cookie, Depends, FastAPI, File, UploadFile, Form, HTTPException, Request, Response
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.middleware.cors import CORSMiddleware
 
-from app.config import settings
+from app.config import settings, model_state
 from app.models.schemas import (
     GenerateResumeRequest,
     ResumeResponse,
     RevisionRequest,
     EvaluationMetrics,
     ATSAnalysis,
+    JobRequirements,
+    ResumeData,
+    TailoredResume,
 )
 from app.services import (
     llm_service,
     resume_extractor,
     job_parser,
     resume_tailor,
-    document_generator,
     evaluator,
 )
-from app.utils import DocumentExtractor
+from app.utils import DocumentExtractor, EXTENSION_HANDLERS, match_keywords
 
 # Configure logging
 logging.basicConfig(
@@ -39,54 +47,232 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+# Background model warm-ups; referenced here so they are not garbage collected
+WARMUP_TASKS: set = set()
+
+
+def _warm_up(*models: str) -> None:
+    """Preload models in Ollama in the background, so the first call skips the load"""
+    if not settings.WARMUP_ON_START:
+        return
+    for model in dict.fromkeys(filter(None, models)):
+        task = asyncio.create_task(llm_service.awarmup(model))
+        WARMUP_TASKS.add(task)
+        task.add_done_callback(WARMUP_TASKS.discard)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    # The home page has no per-request data, so render it once
+    app.state.home_html = templates.get_template("index.html").render()
+    _warm_up(model_state.parsing, model_state.generation)
+    yield
+    for task in list(WARMUP_TASKS):
+        task.cancel()
+    await llm_service.aclose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="AI-powered CV creation and optimization using LLMs",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# CORS headers are static, so build them once at import time
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, PUT, PATCH, DELETE, OPTIONS"),
+    (b"access-control-allow-headers", b"*"),
+]
+
+
+class FastCORS:
+    """Pure ASGI CORS middleware that appends permissive CORS headers"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Answer preflight requests directly
+        if scope["method"] == "OPTIONS":
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": CORS_HEADERS + [(b"content-length", b"0")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(FastCORS)
 
 # Setup static files and templates
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 templates = Jinja2Templates(directory="app/templates")
 
+# Settings used on request paths, bound once at import time
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+OUTPUT_DIR = Path(settings.OUTPUT_DIR).resolve()
+ALLOWED_EXTS = frozenset(settings.ALLOWED_EXTENSIONS)
+EXT_HANDLERS = {ext: h for ext, h in EXTENSION_HANDLERS.items() if ext in ALLOWED_EXTS}
+MAX_FILE_SIZE = settings.MAX_FILE_SIZE
+
 # Create directories
-Path(settings.UPLOAD_DIR).mkdir(exist_ok=True)
-Path(settings.OUTPUT_DIR).mkdir(exist_ok=True)
+UPLOAD_DIR.mkdir(exist_ok=True)
+OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-# Global state for current resume session
-current_session = {
-    "original_resume": None,
-    "tailored_resume": None,
-    "job_requirements": None,
-    "ats_analysis": None,
-}
+# Per-user session state, keyed by session cookie and evicted after inactivity
+SESSION_COOKIE = "session_id"
+SESSIONS: TTLCache = TTLCache(maxsize=settings.MAX_SESSIONS, ttl=settings.SESSION_TTL)
+
+
+class SessionState:
+    """Workflow state for one user session
+
+    The has_* flags are kept in sync by the setters so that status polling
+    is a plain attribute read.
+    """
+
+    __slots__ = (
+        "original_resume",
+        "tailored_resume",
+        "job_requirements",
+        "ats_analysis",
+        "has_resume",
+        "has_job",
+        "has_tailored",
+        "_on_first_write",
+    )
+
+    def __init__(self, on_first_write: Optional[Callable[["SessionState"], None]] = None):
+        self.original_resume: Optional[ResumeData] = None
+        self.tailored_resume: Optional[TailoredResume] = None
+        self.job_requirements: Optional[JobRequirements] = None
+        self.ats_analysis: Optional[ATSAnalysis] = None
+        self.has_resume = False
+        self.has_job = False
+        self.has_tailored = False
+        self._on_first_write = on_first_write
+
+    def _written(self) -> None:
+        """Run the first-write hook (storing a new session) exactly once"""
+        if self._on_first_write is not None:
+            on_first_write, self._on_first_write = self._on_first_write, None
+            on_first_write(self)
+
+    def set_original_resume(self, resume_data: ResumeData) -> None:
+        """Store the uploaded resume"""
+        self._written()
+        self.original_resume = resume_data
+        self.has_resume = True
+
+    def set_job_requirements(self, job_requirements: JobRequirements) -> None:
+        """Store the parsed job requirements"""
+        self._written()
+        self.job_requirements = job_requirements
+        self.has_job = True
+
+    def set_tailored_resume(self, tailored_resume: TailoredResume) -> None:
+        """Store the tailored resume along with its ATS analysis"""
+        self._written()
+        self.tailored_resume = tailored_resume
+        self.ats_analysis = tailored_resume.ats_analysis
+        self.has_tailored = True
+
+
+def get_session(response: Response, session_id: Optional[str] = Cookie(None)) -> SessionState:
+    """Get the session state for the current user
+
+    Unknown users get a blank session that is only stored (and given a cookie)
+    once state is first written, so read-only or cookie-less requests cannot
+    fill SESSIONS and evict real users.
+    """
+    session = SESSIONS.get(session_id) if session_id else None
+    if session is not None:
+        # Re-insert to refresh the TTL on every access
+        SESSIONS[session_id] = session
+        return session
+
+    def store(new_session: SessionState) -> None:
+        new_id = secrets.token_urlsafe(16)
+        SESSIONS[new_id] = new_session
+        response.set_cookie(SESSION_COOKIE, new_id, httponly=True, samesite="lax")
+
+    return SessionState(on_first_write=store)
+
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def _save_upload(src, filepath: Path, size: int) -> None:
+    """Copy an uploaded file to disk, using sendfile where the platform allows it"""
+    with open(filepath, "wb") as dst:
+        # Small uploads are still in the spool's memory buffer; calling fileno()
+        # would first roll them over to a temp file, so write the buffer directly
+        spooled = getattr(src, "_file", None)
+        if isinstance(spooled, io.BytesIO):
+            with spooled.getbuffer() as view:
+                dst.write(view)
+            return
+
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            # No sendfile support for this file pair - fall back to buffered copy
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
+
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            dst.write(chunk)
+
+
+def _save_and_extract(src, filepath: Path, size: int, extract) -> str:
+    """Save an upload and return its cleaned text (all blocking, run in one worker thread)"""
+    _save_upload(src, filepath, size)
+    logger.info(f"Resume uploaded: {filepath}")
+    return DocumentExtractor.clean_text(extract(str(filepath)))
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Render home page"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(request.app.state.home_html)
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    models_status = llm_service.verify_models()
+    models_status = await llm_service.averify_models()
 
     return {
         "status": "healthy",
         "models": models_status,
+        "llm_cache": llm_service.cache.stats() if llm_service.cache else None,
         "timestamp": datetime.now().isoformat(),
     }
 
@@ -95,23 +281,29 @@ async def health_check():
 async def get_available_models():
     """Get list of available Ollama models"""
     try:
-        available_models = llm_service.get_available_models()
+        # llm_service keeps the /api/tags list for a few seconds
+        available_models = await llm_service.aget_available_models()
 
         # Auto-select first model if none is currently selected
         if available_models:
-            if not settings.PARSING_MODEL:
-                settings.PARSING_MODEL = available_models[0]["name"]
-                logger.info(f"Auto-selected parsing model: {settings.PARSING_MODEL}")
+            auto_selected = []
+            if not model_state.parsing:
+                model_state.parsing = available_models[0]["name"]
+                auto_selected.append(model_state.parsing)
+                logger.info(f"Auto-selected parsing model: {model_state.parsing}")
+
+            if not model_state.generation:
+                model_state.generation = available_models[0]["name"]
+                auto_selected.append(model_state.generation)
+                logger.info(f"Auto-selected generation model: {model_state.generation}")
 
-            if not settings.GENERATION_MODEL:
-                settings.GENERATION_MODEL = available_models[0]["name"]
-                logger.info(f"Auto-selected generation model: {settings.GENERATION_MODEL}")
+            _warm_up(*auto_selected)
 
         return {
             "success": True,
             "models": available_models,
-            "current_parsing_model": settings.PARSING_MODEL,
-            "current_generation_model": settings.GENERATION_MODEL,
+            "current_parsing_model": model_state.parsing,
+            "current_generation_model": model_state.generation,
         }
     except Exception as e:
         logger.error(f"Error fetching models: {str(e)}")
@@ -128,20 +320,25 @@ async def select_model(model_name: str = Form(...), model_type: str = Form(defau
     """
     try:
         # Verify model exists
-        available = llm_service.get_available_models()
-        if model_name not in [m["name"] for m in available]:
+        available = await llm_service.aget_available_models()
+        if not any(m["name"] == model_name for m in available):
+            # The model may have been pulled since the list was cached
+            available = await llm_service.aget_available_models(refresh=True)
+        if not any(m["name"] == model_name for m in available):
             raise HTTPException(status_code=400, detail=f"Model {model_name} not found")
 
         # Update settings based on model type
         if model_type == "parsing":
-            settings.PARSING_MODEL = model_name
+            model_state.parsing = model_name
             logger.info(f"Parsing model updated to: {model_name}")
         elif model_type == "generation":
-            settings.GENERATION_MODEL = model_name
+            model_state.generation = model_name
             logger.info(f"Generation model updated to: {model_name}")
         else:
             raise HTTPException(status_code=400, detail=f"Invalid model_type: {model_type}. Use 'parsing' or 'generation'")
 
+        _warm_up(model_name)
+
         return {
             "success": True,
             "message": f"{model_type.capitalize()} model set to {model_name}",
@@ -156,7 +353,7 @@ async def select_model(model_name: str = Form(...), model_type: str = Form(defau
 
 
 @app.post("/api/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
+async def upload_resume(file: UploadFile = File(...), session: SessionState = Depends(get_session)):
     """
     Upload and extract resume data
 
@@ -169,45 +366,68 @@ async def upload_resume(file: UploadFile = File(...)):
     try:
         # Validate file type
         file_ext = Path(file.filename).suffix.lower()
-        if file_ext not in settings.ALLOWED_EXTENSIONS:
+        extract = EXT_HANDLERS.get(file_ext)
+        if extract is None:
             raise HTTPException(
                 status_code=400,
                 detail=f"File type {file_ext} not allowed. Use PDF, DOCX, or TXT.",
             )
 
-        # Save uploaded file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"resume_{timestamp}{file_ext}"
-        filepath = Path(settings.UPLOAD_DIR) / filename
-
-        with open(filepath, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Validate file size
+        size = file.size
+        if size is None:
+            size = file.file.seek(0, os.SEEK_END)
+            file.file.seek(0)
+        if size > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB.",
+            )
 
-        logger.info(f"Resume uploaded: {filepath}")
+        # Save uploaded file
+        filename = f"resume_{time.time_ns()}_{uuid.uuid4().hex[:8]}{file_ext}"
+        filepath = UPLOAD_DIR / filename
 
-        # Extract text
-        extracted_text = DocumentExtractor.extract_and_clean(str(filepath))
+        # Save, extract and clean the text off the event loop in one hop
+        extracted_text = await asyncio.to_thread(
+            _save_and_extract, file.file, filepath, size, extract
+        )
 
         # Extract structured data
-        resume_data = resume_extractor.extract_resume_data(extracted_text)
+        resume_data, skipped_sections = await resume_extractor.aextract_resume_data(
+            extracted_text
+        )
 
         # Store in session
-        current_session["original_resume"] = resume_data
+        session.set_original_resume(resume_data)
+
+        if skipped_sections:
+            message = (
+                "Resume uploaded, but these sections could not be extracted: "
+                + ", ".join(skipped_sections)
+            )
+        else:
+            message = "Resume uploaded and processed successfully"
 
         return {
             "success": True,
-            "message": "Resume uploaded and processed successfully",
-            "data": resume_data.dict(),
+            "message": message,
+            "data": resume_data.model_dump(mode="json", exclude_none=True),
             "extracted_text_length": len(extracted_text),
+            "skipped_sections": skipped_sections,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading resume: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/api/parse-job")
-async def parse_job_description(job_description: str = Form(...)):
+async def parse_job_description(
+    job_description: str = Form(...), session: SessionState = Depends(get_session)
+):
     """
     Parse job description
 
@@ -218,15 +438,17 @@ async def parse_job_description(job_description: str = Form(...)):
         Parsed job requirements
     """
     try:
-        job_requirements = job_parser.parse_job_description(job_description)
+        job_requirements = await llm_service.arun_blocking(
+            job_parser.parse_job_description, job_description
+        )
 
         # Store in session
-        current_session["job_requirements"] = job_requirements
+        session.set_job_requirements(job_requirements)
 
         return {
             "success": True,
             "message": "Job description parsed successfully",
-            "data": job_requirements.dict(),
+            "data": job_requirements.model_dump(mode="json", exclude_none=True),
         }
 
     except Exception as e:
@@ -235,7 +457,9 @@ async def parse_job_description(job_description: str = Form(...)):
 
 
 @app.post("/api/generate-resume", response_model=ResumeResponse)
-async def generate_tailored_resume(request: GenerateResumeRequest):
+async def generate_tailored_resume(
+    request: GenerateResumeRequest, session: SessionState = Depends(get_session)
+):
     """
     Generate tailored resume
 
@@ -246,36 +470,40 @@ async def generate_tailored_resume(request: GenerateResumeRequest):
         Generated resume file path and analysis
     """
     try:
-        if not current_session.get("original_resume"):
+        if not session.has_resume:
             raise HTTPException(status_code=400, detail="No resume uploaded")
 
         # Parse job description if not already done
-        if not current_session.get("job_requirements"):
-            job_requirements = job_parser.parse_job_description(request.job_description)
-            current_session["job_requirements"] = job_requirements
+        if not session.has_job:
+            job_requirements = await llm_service.arun_blocking(
+                job_parser.parse_job_description, request.job_description
+            )
+            session.set_job_requirements(job_requirements)
         else:
-            job_requirements = current_session["job_requirements"]
+            job_requirements = session.job_requirements
 
         # Tailor resume
-        tailored_resume = resume_tailor.tailor_resume(
-            resume_data=current_session["original_resume"],
+        tailored_resume = await resume_tailor.atailor_resume(
+            resume_data=session.original_resume,
             job_requirements=job_requirements,
             optimization_level=request.optimization_level,
         )
 
         # Store in session
-        current_session["tailored_resume"] = tailored_resume
-        current_session["ats_analysis"] = tailored_resume.ats_analysis
+        session.set_tailored_resume(tailored_resume)
 
-        # Generate document
-        output_path = document_generator.generate(
+        # Generate document (document libraries are loaded on first use)
+        from app.services import document_generator
+
+        output_path = await asyncio.to_thread(
+            document_generator.generate,
             resume_data=tailored_resume.resume_data,
             format=request.target_format,
         )
 
         # Evaluate quality
         metrics = evaluator.evaluate(
-            original_resume=current_session["original_resume"],
+            original_resume=session.original_resume,
             tailored_resume=tailored_resume.resume_data,
             job_requirements=job_requirements,
             ats_analysis=tailored_resume.ats_analysis,
@@ -289,7 +517,7 @@ async def generate_tailored_resume(request: GenerateResumeRequest):
             metadata={
                 "customizations": tailored_resume.customizations_made,
                 "relevance_score": tailored_resume.relevance_score,
-                "evaluation": metrics.dict(),
+                "evaluation": metrics.model_dump(mode="json"),
             },
         )
 
@@ -301,9 +529,13 @@ async def generate_tailored_resume(request: GenerateResumeRequest):
 @app.get("/api/download/{filename}")
 async def download_resume(filename: str):
     """Download generated resume"""
-    filepath = Path(settings.OUTPUT_DIR) / filename
+    filepath = OUTPUT_DIR / filename
+
+    # Reject paths that escape the output directory (e.g. "../")
+    if not filepath.resolve().is_relative_to(OUTPUT_DIR):
+        raise HTTPException(status_code=400, detail="Invalid filename")
 
-    if not filepath.exists():
+    if not filepath.is_file():
         raise HTTPException(status_code=404, detail="File not found")
 
     return FileResponse(
@@ -313,8 +545,11 @@ async def download_resume(filename: str):
     )
 
 
+_SKILL_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
 @app.post("/api/revise-section")
-async def revise_section(request: RevisionRequest):
+async def revise_section(request: RevisionRequest, session: SessionState = Depends(get_session)):
     """
     Revise specific resume section
 
@@ -325,11 +560,11 @@ async def revise_section(request: RevisionRequest):
         Revised content
     """
     try:
-        if not current_session.get("tailored_resume"):
+        if not session.has_tailored:
             raise HTTPException(status_code=400, detail="No tailored resume available")
 
-        tailored_data = current_session["tailored_resume"].resume_data
-        job_req = current_session.get("job_requirements")
+        tailored_data = session.tailored_resume.resume_data
+        job_req = session.job_requirements
 
         # Handle different sections
         if request.section == "summary":
@@ -347,7 +582,7 @@ Job requirements:
 Revise the summary following the instructions while maintaining ATS optimization.
 Return ONLY the revised summary."""
 
-            revised = llm_service.generate_text(prompt, system_prompt)
+            revised = await llm_service.agenerate_text(prompt, system_prompt)
             tailored_data.summary = revised.strip()
 
         elif request.section == "skills":
@@ -362,13 +597,13 @@ User instructions:
 
 Provide a revised list of skills as a comma-separated string."""
 
-            revised = llm_service.generate_text(prompt)
-            tailored_data.skills = [s.strip() for s in revised.split(",")]
+            revised = await llm_service.agenerate_text(prompt)
+            tailored_data.skills = [s for s in _SKILL_SPLIT_RE.split(revised.strip()) if s]
 
         # Re-evaluate if needed
         if request.preserve_ats_score and job_req:
             new_analysis = resume_tailor._analyze_ats_compliance(tailored_data, job_req)
-            current_session["ats_analysis"] = new_analysis
+            session.ats_analysis = new_analysis
 
         return {
             "success": True,
@@ -382,23 +617,17 @@ Provide a revised list of skills as a comma-separated string."""
 
 
 @app.get("/api/evaluation")
-async def get_evaluation() -> EvaluationMetrics:
+async def get_evaluation(session: SessionState = Depends(get_session)) -> EvaluationMetrics:
     """Get current resume evaluation metrics"""
     try:
-        if not all(
-            [
-                current_session.get("original_resume"),
-                current_session.get("tailored_resume"),
-                current_session.get("job_requirements"),
-            ]
-        ):
+        if not (session.has_resume and session.has_tailored and session.has_job):
             raise HTTPException(status_code=400, detail="Complete workflow first")
 
         metrics = evaluator.evaluate(
-            original_resume=current_session["original_resume"],
-            tailored_resume=current_session["tailored_resume"].resume_data,
-            job_requirements=current_session["job_requirements"],
-            ats_analysis=current_session["ats_analysis"],
+            original_resume=session.original_resume,
+            tailored_resume=session.tailored_resume.resume_data,
+            job_requirements=session.job_requirements,
+            ats_analysis=session.ats_analysis,
         )
 
         return metrics
@@ -408,79 +637,60 @@ async def get_evaluation() -> EvaluationMetrics:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Fields of ResumeData exposed to the editor by /api/resume-data
+RESUME_DATA_FIELDS = {
+    "personal_info": {"name", "email", "phone", "location", "linkedin", "github"},
+    "summary": True,
+    "skills": True,
+    "experience": {"__all__": {"position", "company", "start_date", "end_date", "responsibilities"}},
+    "education": {"__all__": {"degree", "institution", "field_of_study", "start_date", "end_date", "gpa"}},
+    "projects": {"__all__": {"name", "description", "technologies"}},
+}
+
+
 @app.get("/api/resume-data")
-async def get_resume_data():
+async def get_resume_data(session: SessionState = Depends(get_session)):
     """Get full tailored resume data for editing"""
     try:
-        if not current_session.get("tailored_resume"):
+        if not session.has_tailored:
             raise HTTPException(status_code=400, detail="No tailored resume available")
 
-        tailored_resume = current_session["tailored_resume"]
-        resume_data = tailored_resume.resume_data
+        data = session.tailored_resume.resume_data.model_dump(
+            mode="json", include=RESUME_DATA_FIELDS
+        )
+
+        # Editable text fields are returned as "" rather than null
+        data["personal_info"] = {k: v or "" for k, v in data["personal_info"].items()}
+        data["summary"] = data["summary"] or ""
+        data["education"] = [{k: v or "" for k, v in edu.items()} for edu in data["education"]]
+        data["projects"] = data["projects"] or []
 
-        return {
-            "success": True,
-            "data": {
-                "personal_info": {
-                    "name": resume_data.personal_info.name,
-                    "email": resume_data.personal_info.email or "",
-                    "phone": resume_data.personal_info.phone or "",
-                    "location": resume_data.personal_info.location or "",
-                    "linkedin": resume_data.personal_info.linkedin or "",
-                    "github": resume_data.personal_info.github or "",
-                },
-                "summary": resume_data.summary or "",
-                "skills": resume_data.skills,
-                "experience": [
-                    {
-                        "position": exp.position,
-                        "company": exp.company,
-                        "start_date": exp.start_date,
-                        "end_date": exp.end_date,
-                        "responsibilities": exp.responsibilities,
-                    }
-                    for exp in resume_data.experience
-                ],
-                "education": [
-                    {
-                        "degree": edu.degree,
-                        "institution": edu.institution,
-                        "field_of_study": edu.field_of_study or "",
-                        "start_date": edu.start_date or "",
-                        "end_date": edu.end_date or "",
-                        "gpa": edu.gpa or "",
-                    }
-                    for edu in resume_data.education
-                ],
-                "projects": [
-                    {
-                        "name": proj.name,
-                        "description": proj.description,
-                        "technologies": proj.technologies,
-                    }
-                    for proj in (resume_data.projects or [])
-                ],
-            },
-        }
+        return {"success": True, "data": data}
     except Exception as e:
         logger.error(f"Error getting resume data: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _resume_text(resume: ResumeData) -> str:
+    """Lowercased text of a resume's skills, positions and responsibilities"""
+    parts = list(resume.skills)
+    for exp in resume.experience:
+        parts.append(exp.position)
+    for exp in resume.experience:
+        parts += exp.responsibilities
+    return " ".join(parts).lower()
+
+
 @app.get("/api/comparison")
-async def get_comparison():
+async def get_comparison(session: SessionState = Depends(get_session)):
     """Get before/after comparison of resume"""
     try:
-        if not all([
-            current_session.get("original_resume"),
-            current_session.get("tailored_resume"),
-            current_session.get("job_requirements"),
-        ]):
+        if not (session.has_resume and session.has_tailored and session.has_job):
             raise HTTPException(status_code=400, detail="Complete workflow first")
 
-        original = current_session["original_resume"]
-        tailored = current_session["tailored_resume"].resume_data
-        job_req = current_session["job_requirements"]
+        original = session.original_resume
+        tailored = session.tailored_resume.resume_data
+        job_req = session.job_requirements
 
         # Compare skills
         original_skills = set(s.lower() for s in original.skills)
@@ -497,22 +707,14 @@ async def get_comparison():
         job_keywords_lower = [k.lower() for k in job_req.keywords]
 
         # Original resume keyword match
-        original_text = " ".join([
-            *original.skills,
-            *[exp.position for exp in original.experience],
-            *[resp for exp in original.experience for resp in exp.responsibilities]
-        ]).lower()
+        original_text = _resume_text(original)
 
-        original_matched = [kw for kw in job_keywords_lower if kw in original_text]
+        original_matched = match_keywords(job_keywords_lower, original_text)
 
         # Tailored resume keyword match
-        tailored_text = " ".join([
-            *tailored.skills,
-            *[exp.position for exp in tailored.experience],
-            *[resp for exp in tailored.experience for resp in exp.responsibilities]
-        ]).lower()
+        tailored_text = _resume_text(tailored)
 
-        tailored_matched = [kw for kw in job_keywords_lower if kw in tailored_text]
+        tailored_matched = match_keywords(job_keywords_lower, tailored_text)
 
         # Calculate scores
         original_score = len(original_matched) / len(job_keywords_lower) if job_keywords_lower else 0
@@ -523,7 +725,7 @@ async def get_comparison():
         original_overall_quality = round(original_score * 0.85, 2)  # Slightly lower estimate
 
         # Get actual scores from tailored resume
-        ats_analysis = current_session.get("ats_analysis")
+        ats_analysis = session.ats_analysis
         if ats_analysis and hasattr(ats_analysis, 'overall_score'):
             tailored_overall_score = ats_analysis.overall_score
         else:
@@ -583,7 +785,7 @@ async def get_comparison():
                     "percentage_improvement": round((tailored_score - original_score) * 100, 1) if original_score > 0 else 0,
                 }
             },
-            "customizations": current_session["tailored_resume"].customizations_made,
+            "customizations": session.tailored_resume.customizations_made,
         }
 
     except Exception as e:
@@ -592,17 +794,17 @@ async def get_comparison():
 
 
 @app.get("/api/session-status")
-async def get_session_status():
+async def get_session_status(session: SessionState = Depends(get_session)):
     """Get current session status"""
     return {
-        "resume_uploaded": current_session.get("original_resume") is not None,
-        "job_parsed": current_session.get("job_requirements") is not None,
-        "resume_tailored": current_session.get("tailored_resume") is not None,
+        "resume_uploaded": session.has_resume,
+        "job_parsed": session.has_job,
+        "resume_tailored": session.has_tailored,
     }
 
 
 @app.post("/api/recompare")
-async def recompare_resume(request: dict):
+async def recompare_resume(request: dict, session: SessionState = Depends(get_session)):
     """
     Recompare resume after user edits
 
@@ -613,7 +815,7 @@ async def recompare_resume(request: dict):
         Updated comparison and analysis
     """
     try:
-        if not current_session.get("original_resume") or not current_session.get("job_requirements"):
+        if not session.has_resume or not session.has_job:
             raise HTTPException(status_code=400, detail="No session data available")
 
         # Get updated data from request
@@ -622,10 +824,10 @@ async def recompare_resume(request: dict):
         updated_experience = request.get("experience", [])
 
         # Get the current tailored resume
-        if not current_session.get("tailored_resume"):
+        if not session.has_tailored:
             raise HTTPException(status_code=400, detail="No tailored resume available")
 
-        tailored_resume = current_session["tailored_resume"]
+        tailored_resume = session.tailored_resume
 
         # Update the resume data
         tailored_resume.resume_data.summary = updated_summary
@@ -640,15 +842,17 @@ async def recompare_resume(request: dict):
         from app.services.resume_tailor import resume_tailor
         ats_analysis = resume_tailor._analyze_ats_compliance(
             tailored_resume.resume_data,
-            current_session["job_requirements"]
+            session.job_requirements
         )
 
         # Update session
-        current_session["tailored_resume"] = tailored_resume
-        current_session["ats_analysis"] = ats_analysis
+        session.ats_analysis = ats_analysis
 
         # Regenerate document with updated data
-        output_path = document_generator.generate(
+        from app.services import document_generator
+
+        output_path = await asyncio.to_thread(
+            document_generator.generate,
             resume_data=tailored_resume.resume_data,
             format="pdf",
         )
@@ -656,7 +860,7 @@ async def recompare_resume(request: dict):
         return {
             "success": True,
             "message": "Resume recompared successfully",
-            "ats_analysis": ats_analysis.dict(),
+            "ats_analysis": ats_analysis.model_dump(mode="json"),
             "file_path": output_path,
         }
 
@@ -666,15 +870,10 @@ async def recompare_resume(request: dict):
 
 
 @app.post("/api/reset")
-async def reset_session():
+async def reset_session(session_id: Optional[str] = Cookie(None)):
     """Reset current session"""
-    current_session.clear()
-    current_session.update({
-        "original_resume": None,
-        "tailored_resume": None,
-        "job_requirements": None,
-        "ats_analysis": None,
-    })
+    if session_id:
+        SESSIONS.pop(session_id, None)
 
     return {"success": True, "message": "Session reset successfully"}
 
@@ -682,9 +881,11 @@ async def reset_session():
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http stay on "auto": uvloop and httptools where installed (not on Windows)
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
+        workers=1 if settings.DEBUG else settings.WORKERS,
         reload=settings.DEBUG,
     )
@@ -1,13 +1,18 @@
 """
 Pydantic models for data validation and serialization
 """
-from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+from typing import Iterable, List, Optional, Dict, Any, Type
 from datetime import datetime
 
+# Shared model config: no re-validation on attribute assignment, unknown fields dropped
+MODEL_CONFIG = ConfigDict(validate_assignment=False, extra="ignore")
+
 
 class PersonalInfo(BaseModel):
     """Personal information schema"""
+    model_config = MODEL_CONFIG
+
     name: str
     email: Optional[str] = None
     phone: Optional[str] = None
@@ -19,6 +24,8 @@ class PersonalInfo(BaseModel):
 
 class Education(BaseModel):
     """Education entry schema"""
+    model_config = MODEL_CONFIG
+
     institution: str
     degree: str
     field_of_study: Optional[str] = None
@@ -30,6 +37,8 @@ class Education(BaseModel):
 
 class Experience(BaseModel):
     """Work experience entry schema"""
+    model_config = MODEL_CONFIG
+
     company: str
     position: str
     location: Optional[str] = None
@@ -42,6 +51,8 @@ class Experience(BaseModel):
 
 class Project(BaseModel):
     """Project entry schema"""
+    model_config = MODEL_CONFIG
+
     name: str
     description: str
     technologies: List[str] = []
@@ -51,6 +62,8 @@ class Project(BaseModel):
 
 class Certification(BaseModel):
     """Certification entry schema"""
+    model_config = MODEL_CONFIG
+
     name: str
     issuer: Optional[str] = None
     date: Optional[str] = None
@@ -59,6 +72,8 @@ class Certification(BaseModel):
 
 class ResumeData(BaseModel):
     """Complete resume data structure"""
+    model_config = MODEL_CONFIG
+
     personal_info: PersonalInfo
     summary: Optional[str] = None
     education: List[Education] = []
@@ -72,6 +87,8 @@ class ResumeData(BaseModel):
 
 class JobRequirements(BaseModel):
     """Job description requirements schema"""
+    model_config = MODEL_CONFIG
+
     job_title: str
     company: Optional[str] = None
     required_skills: List[str] = []
@@ -84,6 +101,8 @@ class JobRequirements(BaseModel):
 
 class ATSAnalysis(BaseModel):
     """ATS compatibility analysis"""
+    model_config = MODEL_CONFIG
+
     overall_score: float = Field(..., ge=0, le=1)
     keyword_match_score: float = Field(..., ge=0, le=1)
     matched_keywords: List[str] = []
@@ -91,10 +110,13 @@ class ATSAnalysis(BaseModel):
     suggestions: List[str] = []
     format_compliance: bool = True
     section_coverage: Dict[str, bool] = {}
+    coverage_score: float = Field(0, ge=0, le=1)  # share of section_coverage present
 
 
 class TailoredResume(BaseModel):
     """Tailored resume response"""
+    model_config = MODEL_CONFIG
+
     resume_data: ResumeData
     ats_analysis: ATSAnalysis
     customizations_made: List[str] = []
@@ -103,6 +125,8 @@ class TailoredResume(BaseModel):
 
 class GenerateResumeRequest(BaseModel):
     """Request to generate tailored resume"""
+    model_config = MODEL_CONFIG
+
     job_description: str
     target_format: str = Field(default="pdf", pattern="^(pdf|docx)$")
     include_summary: bool = True
@@ -111,6 +135,8 @@ class GenerateResumeRequest(BaseModel):
 
 class ResumeResponse(BaseModel):
     """Response after resume generation"""
+    model_config = MODEL_CONFIG
+
     success: bool
     message: str
     file_path: Optional[str] = None
@@ -120,6 +146,8 @@ class ResumeResponse(BaseModel):
 
 class RevisionRequest(BaseModel):
     """Request for resume revision"""
+    model_config = MODEL_CONFIG
+
     section: str  # e.g., "summary", "experience", "skills"
     instructions: str
     preserve_ats_score: bool = True
@@ -127,6 +155,8 @@ class RevisionRequest(BaseModel):
 
 class EvaluationMetrics(BaseModel):
     """Evaluation metrics for resume quality"""
+    model_config = MODEL_CONFIG
+
     relevance_to_job: float = Field(..., ge=0, le=1)
     experience_coverage: float = Field(..., ge=0, le=1)
     achievement_coverage: float = Field(..., ge=0, le=1)
@@ -134,3 +164,30 @@ class EvaluationMetrics(BaseModel):
     keyword_density: float = Field(..., ge=0, le=1)
     overall_quality: float = Field(..., ge=0, le=1)
     recommendations: List[str] = []
+
+
+def llm_output_schema(
+    model: Type[BaseModel], fields: Optional[Iterable[str]] = None
+) -> Dict[str, Any]:
+    """
+    JSON Schema for constraining an LLM's JSON output to a model
+
+    Every top-level property is marked required, so constrained decoding
+    emits all of them instead of stopping at the required minimum.
+
+    Args:
+        model: Pydantic model the response will be validated into
+        fields: Optional subset of top-level fields to include
+
+    Returns:
+        JSON Schema dictionary
+    """
+    schema = model.model_json_schema()
+    properties = schema["properties"]
+    if fields is not None:
+        properties = {name: properties[name] for name in fields}
+
+    output_schema = {"type": "object", "properties": properties, "required": list(properties)}
+    if "$defs" in schema:
+        output_schema["$defs"] = schema["$defs"]
+    return output_schema
@@ -1,16 +1,25 @@
 """Services package"""
-from .llm_service import llm_service
-from .resume_extractor import resume_extractor
-from .job_parser import job_parser
-from .resume_tailor import resume_tailor
-from .document_generator import document_generator
-from .evaluator import evaluator
+import importlib
 
-__all__ = [
-    "llm_service",
-    "resume_extractor",
-    "job_parser",
-    "resume_tailor",
-    "document_generator",
-    "evaluator",
-]
+# Services are imported on first access so that importing one service
+# doesn't pull in the heavy document libraries used by the others
+_SERVICE_MODULES = {
+    "llm_service": ".llm_service",
+    "resume_extractor": ".resume_extractor",
+    "job_parser": ".job_parser",
+    "resume_tailor": ".resume_tailor",
+    "document_generator": ".document_generator",
+    "evaluator": ".evaluator",
+}
+
+__all__ = list(_SERVICE_MODULES)
+
+
+def __getattr__(name):
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    service = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = service
+    return service
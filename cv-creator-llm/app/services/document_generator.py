@@ -1,9 +1,13 @@
 """
 Document generation service - Generate PDF and DOCX resumes
 """
+import gc
+import io
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Tuple
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -25,30 +29,62 @@ class DocumentGenerator:
         self.output_dir = Path(settings.OUTPUT_DIR)
         self.output_dir.mkdir(exist_ok=True)
 
+        # PDF styles are built once and shared by every generated document
+        self._styles = getSampleStyleSheet()
+        self._title_style = ParagraphStyle('CustomTitle', parent=self._styles['Heading1'],
+                                           fontSize=18, textColor=colors.HexColor('#2C3E50'),
+                                           spaceAfter=6, alignment=1)
+        self._heading_style = ParagraphStyle('CustomHeading', parent=self._styles['Heading2'],
+                                             fontSize=14, textColor=colors.HexColor('#2C3E50'),
+                                             spaceAfter=6, spaceBefore=12)
+        self._normal_style = ParagraphStyle('Body', parent=self._styles['Normal'], fontSize=10)
+        self._contact_style = ParagraphStyle('Contact', parent=self._normal_style, alignment=1)
+
+        # DOCX documents are opened from a pre-built template instead of
+        # being set up from scratch on every call
+        self._docx_template = self._build_docx_template()
+
+    def _build_docx_template(self) -> bytes:
+        """Build the base DOCX document (page setup) and return it as bytes"""
+        doc = Document()
+
+        # Set margins
+        for section in doc.sections:
+            section.top_margin = Inches(0.75)
+            section.bottom_margin = Inches(0.75)
+            section.left_margin = Inches(0.75)
+            section.right_margin = Inches(0.75)
+
+        # Section headings take their colour from the style, not per run
+        doc.styles['Heading 2'].font.color.rgb = RGBColor(44, 62, 80)
+
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+
     def generate_pdf(self, resume_data: ResumeData, filename: str = None) -> str:
         """Generate PDF resume"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.pdf"
+            filename = f"resume_{time.time_ns()}.pdf"
 
         filepath = self.output_dir / filename
+        filepath.write_bytes(self.generate_pdf_bytes(resume_data))
 
-        doc = SimpleDocTemplate(str(filepath), pagesize=letter,
+        logger.info(f"Generated PDF resume: {filepath}")
+        return str(filepath)
+
+    def generate_pdf_bytes(self, resume_data: ResumeData) -> bytes:
+        """Render PDF resume in memory and return its bytes"""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter,
                                 rightMargin=0.75*inch, leftMargin=0.75*inch,
                                 topMargin=0.75*inch, bottomMargin=0.75*inch)
 
         story = []
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'],
-                                      fontSize=18, textColor=colors.HexColor('#2C3E50'),
-                                      spaceAfter=6, alignment=1)
-        heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'],
-                                       fontSize=14, textColor=colors.HexColor('#2C3E50'),
-                                       spaceAfter=6, spaceBefore=12)
-        normal_style = styles['Normal']
-        normal_style.fontSize = 10
+        title_style = self._title_style
+        heading_style = self._heading_style
+        normal_style = self._normal_style
+        contact_style = self._contact_style
 
         # Name
         story.append(Paragraph(resume_data.personal_info.name, title_style))
@@ -64,7 +100,6 @@ class DocumentGenerator:
             contact_parts.append(resume_data.personal_info.location)
 
         contact_text = " | ".join(contact_parts)
-        contact_style = ParagraphStyle('Contact', parent=normal_style, alignment=1)
         story.append(Paragraph(contact_text, contact_style))
         story.append(Spacer(1, 0.1*inch))
 
@@ -145,26 +180,16 @@ class DocumentGenerator:
                 story.append(Spacer(1, 0.1*inch))
 
         doc.build(story)
-        logger.info(f"Generated PDF resume: {filepath}")
-        return str(filepath)
+        return buffer.getvalue()
 
     def generate_docx(self, resume_data: ResumeData, filename: str = None) -> str:
         """Generate DOCX resume"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"resume_{timestamp}.docx"
+            filename = f"resume_{time.time_ns()}.docx"
 
         filepath = self.output_dir / filename
 
-        doc = Document()
-
-        # Set margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.75)
-            section.bottom_margin = Inches(0.75)
-            section.left_margin = Inches(0.75)
-            section.right_margin = Inches(0.75)
+        doc = Document(io.BytesIO(self._docx_template))
 
         # Name
         name = doc.add_paragraph(resume_data.personal_info.name)
@@ -200,20 +225,17 @@ class DocumentGenerator:
 
         # Summary
         if resume_data.summary:
-            heading = doc.add_heading("PROFESSIONAL SUMMARY", level=2)
-            heading.runs[0].font.color.rgb = RGBColor(44, 62, 80)
+            doc.add_heading("PROFESSIONAL SUMMARY", level=2)
             doc.add_paragraph(resume_data.summary)
 
         # Skills
         if resume_data.skills:
-            heading = doc.add_heading("SKILLS", level=2)
-            heading.runs[0].font.color.rgb = RGBColor(44, 62, 80)
+            doc.add_heading("SKILLS", level=2)
             doc.add_paragraph(", ".join(resume_data.skills))
 
         # Experience
         if resume_data.experience:
-            heading = doc.add_heading("PROFESSIONAL EXPERIENCE", level=2)
-            heading.runs[0].font.color.rgb = RGBColor(44, 62, 80)
+            doc.add_heading("PROFESSIONAL EXPERIENCE", level=2)
 
             for exp in resume_data.experience:
                 # Position and company
@@ -233,8 +255,7 @@ class DocumentGenerator:
 
         # Education
         if resume_data.education:
-            heading = doc.add_heading("EDUCATION", level=2)
-            heading.runs[0].font.color.rgb = RGBColor(44, 62, 80)
+            doc.add_heading("EDUCATION", level=2)
 
             for edu in resume_data.education:
                 edu_para = doc.add_paragraph()
@@ -249,8 +270,7 @@ class DocumentGenerator:
 
         # Projects
         if resume_data.projects:
-            heading = doc.add_heading("PROJECTS", level=2)
-            heading.runs[0].font.color.rgb = RGBColor(44, 62, 80)
+            doc.add_heading("PROJECTS", level=2)
 
             for proj in resume_data.projects:
                 proj_para = doc.add_paragraph()
@@ -260,6 +280,11 @@ class DocumentGenerator:
                     doc.add_paragraph(f"Technologies: {', '.join(proj.technologies)}")
 
         doc.save(str(filepath))
+
+        # python-docx part graphs are cyclic, so reclaim the XML tree now
+        del doc
+        gc.collect()
+
         logger.info(f"Generated DOCX resume: {filepath}")
         return str(filepath)
 
@@ -272,6 +297,21 @@ class DocumentGenerator:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
+    def generate_both(self, resume_data: ResumeData) -> Tuple[str, str]:
+        """
+        Generate PDF and DOCX resumes concurrently
+
+        Args:
+            resume_data: Resume to render
+
+        Returns:
+            Tuple of (pdf_path, docx_path)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pdf_future = executor.submit(self.generate_pdf, resume_data)
+            docx_future = executor.submit(self.generate_docx, resume_data)
+            return pdf_future.result(), docx_future.result()
+
 
 # Global instance
 document_generator = DocumentGenerator()
@@ -2,11 +2,65 @@
 Resume evaluation and metrics service
 """
 import logging
-from typing import Dict, List
+import re
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple
 from app.models.schemas import ResumeData, JobRequirements, EvaluationMetrics, ATSAnalysis
 
+try:
+    import ahocorasick  # Optional: single-pass multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Words and symbols that indicate a quantified achievement
+_ACHIEVEMENT_RE = re.compile(
+    r"increased|decreased|improved|generated|saved|reduced|achieved|delivered|%|million|thousand",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=32)
+def _build_automaton(needles: Tuple[str, ...]):
+    """Build (and memoize per needle set) an Aho-Corasick automaton"""
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_substrings(text: str, needles: Tuple[str, ...]) -> Set[str]:
+    """Return the needles that occur in text
+
+    Uses one Aho-Corasick pass over the text when pyahocorasick is installed,
+    otherwise falls back to a substring check per needle.
+    """
+    if not needles:
+        return set()
+    if ahocorasick is None:
+        return {needle for needle in needles if needle in text}
+    return {needle for _, needle in _build_automaton(needles).iter(text)}
+
+
+class _Lowered:
+    """Lowercased resume/job fields, computed once per evaluation"""
+
+    __slots__ = (
+        "skills", "required_skills", "required_skills_set", "title_words", "position_words",
+    )
+
+    def __init__(self, resume: ResumeData, job_req: JobRequirements):
+        self.skills = frozenset(s.lower() for s in resume.skills)
+        self.required_skills = [s.lower() for s in job_req.required_skills]
+        self.required_skills_set = frozenset(self.required_skills)
+        # Position titles are only compared against the job title
+        self.title_words = frozenset(job_req.job_title.lower().split())
+        self.position_words = [
+            frozenset(exp.position.lower().split()) for exp in resume.experience
+        ] if self.title_words else []
+
 
 class ResumeEvaluator:
     """Evaluate resume quality and relevance"""
@@ -30,12 +84,16 @@ class ResumeEvaluator:
         Returns:
             EvaluationMetrics with detailed scores
         """
+        lowered = _Lowered(tailored_resume, job_requirements)
+
         # 1. Relevance to job
-        relevance_score = self._calculate_relevance(tailored_resume, job_requirements)
+        relevance_score = self._calculate_relevance(
+            tailored_resume, job_requirements, lowered
+        )
 
         # 2. Experience coverage
         experience_coverage = self._calculate_experience_coverage(
-            tailored_resume, job_requirements
+            tailored_resume, job_requirements, lowered
         )
 
         # 3. Achievement coverage
@@ -77,37 +135,28 @@ class ResumeEvaluator:
         )
 
     def _calculate_relevance(
-        self, resume: ResumeData, job_req: JobRequirements
+        self, resume: ResumeData, job_req: JobRequirements, lowered: _Lowered
     ) -> float:
         """Calculate job relevance score"""
         score = 0.0
         factors = 0
 
         # Skills match
-        resume_skills_lower = [s.lower() for s in resume.skills]
-        required_skills_lower = [s.lower() for s in job_req.required_skills]
-
-        if required_skills_lower:
-            skills_match = sum(
-                1 for skill in required_skills_lower if skill in resume_skills_lower
-            )
-            score += skills_match / len(required_skills_lower)
+        if lowered.required_skills_set:
+            skills_match = len(lowered.required_skills_set & lowered.skills)
+            score += skills_match / len(lowered.required_skills_set)
             factors += 1
 
         # Experience match (check if position titles match job title)
         if job_req.job_title and resume.experience:
-            job_title_words = set(job_req.job_title.lower().split())
-            for exp in resume.experience:
-                position_words = set(exp.position.lower().split())
-                if job_title_words & position_words:
-                    score += 0.3
-                    break
+            if any(lowered.title_words & words for words in lowered.position_words):
+                score += 0.3
             factors += 1
 
         return score / factors if factors > 0 else 0.0
 
     def _calculate_experience_coverage(
-        self, resume: ResumeData, job_req: JobRequirements
+        self, resume: ResumeData, job_req: JobRequirements, lowered: _Lowered
     ) -> float:
         """Calculate how well experience covers job requirements"""
         if not resume.experience:
@@ -123,44 +172,39 @@ class ResumeEvaluator:
 
         resp_text = " ".join(all_responsibilities)
 
+        # Find every requirement word and skill in one pass over the text
+        req_words = [
+            [word for word in req_resp.lower().split() if len(word) > 4]
+            for req_resp in job_req.responsibilities[:10]
+        ]
+        skills = lowered.required_skills[:10]
+        needles = {word for words in req_words for word in words}
+        needles.update(skill for skill in skills if skill)
+        found = _find_substrings(resp_text, tuple(sorted(needles)))
+
         # Check coverage of job responsibilities
-        for req_resp in job_req.responsibilities[:10]:
+        for words in req_words:
             total_points += 1
-            if any(word in resp_text for word in req_resp.lower().split() if len(word) > 4):
+            if any(word in found for word in words):
                 coverage_points += 1
 
         # Check coverage of required skills
-        for skill in job_req.required_skills[:10]:
+        for skill in skills:
             total_points += 1
-            if skill.lower() in resp_text:
+            if not skill or skill in found:
                 coverage_points += 1
 
         return coverage_points / total_points if total_points > 0 else 0.0
 
     def _calculate_achievement_coverage(self, resume: ResumeData) -> float:
         """Calculate achievement and impact coverage"""
-        achievement_indicators = [
-            "increased",
-            "decreased",
-            "improved",
-            "generated",
-            "saved",
-            "reduced",
-            "achieved",
-            "delivered",
-            "%",
-            "million",
-            "thousand",
-        ]
-
         total_bullets = 0
         bullets_with_achievements = 0
 
         for exp in resume.experience:
             for resp in exp.responsibilities:
                 total_bullets += 1
-                resp_lower = resp.lower()
-                if any(indicator in resp_lower for indicator in achievement_indicators):
+                if _ACHIEVEMENT_RE.search(resp):
                     bullets_with_achievements += 1
 
         return bullets_with_achievements / total_bullets if total_bullets > 0 else 0.0
@@ -1,20 +1,137 @@
 """
 Job description parsing service
 """
+import hashlib
 import logging
 import re
+import threading
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 from typing import List, Dict, Any
+from cachetools import LRUCache
+from pydantic import ValidationError
 from app.services.llm_service import llm_service
-from app.models.schemas import JobRequirements
+from app.models.schemas import JobRequirements, llm_output_schema
 
 logger = logging.getLogger(__name__)
 
+# Constrains the LLM's JSON output to the JobRequirements shape
+JOB_SCHEMA = llm_output_schema(JobRequirements)
+
+# Parsed job descriptions, keyed by content hash. Kept in memory only: the LLM
+# response cache already persists the underlying low-temperature parse call
+JD_CACHE_SIZE = 256
+# Texts shorter than this are rescanned rather than memoized
+KEYWORD_CACHE_MIN_LENGTH = 512
+
+# Common skill patterns
+_SKILL_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r'\b(?:proficient|experience|skilled|knowledge)\s+(?:in|with)\s+([\w\s\+\#\.]+)',
+        r'\b([\w\+\#]+)\s+(?:developer|engineer|specialist|expert)',
+        r'\b(?:using|including|such as)\s+([\w\s,\+\#\.]+)',
+    )
+]
+
+# Word tokens for n-gram extraction
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Acronyms (2-5 uppercase letters)
+_ACRONYM_RE = re.compile(r'\b[A-Z]{2,5}\b')
+
+# Common programming languages and technologies
+TECH_KEYWORDS = [
+    'Python',
+    'Java',
+    'JavaScript',
+    'C++',
+    'C#',
+    'Ruby',
+    'PHP',
+    'Swift',
+    'Kotlin',
+    'Go',
+    'Rust',
+    'TypeScript',
+    'SQL',
+    'NoSQL',
+    'React',
+    'Angular',
+    'Vue',
+    'Node.js',
+    'Django',
+    'Flask',
+    'Spring',
+    'AWS',
+    'Azure',
+    'GCP',
+    'Docker',
+    'Kubernetes',
+    'Git',
+    'CI/CD',
+    'Agile',
+    'Scrum',
+    'REST',
+    'GraphQL',
+    'Machine Learning',
+    'Deep Learning',
+    'AI',
+    'Data Science',
+    'DevOps',
+]
+
+# All tech keywords as one alternation, so the text is scanned once.
+# Lookarounds rather than \b, so terms ending in a symbol (C++, C#) match
+_TECH_RE = re.compile(
+    r'(?<!\w)(?:' + '|'.join(re.escape(tech) for tech in TECH_KEYWORDS) + r')(?!\w)',
+    re.IGNORECASE,
+)
+_TECH_CANONICAL = {tech.lower(): tech for tech in TECH_KEYWORDS}
+
+
+def _additional_keywords(text: str) -> tuple:
+    """Pattern-matched keywords for text"""
+    keywords = []
+
+    # Common skill patterns
+    for pattern in _SKILL_PATTERNS:
+        for match in pattern.finditer(text):
+            keyword = match.group(1).strip()
+            if len(keyword) > 2 and len(keyword) < 50:
+                keywords.append(keyword)
+
+    # Extract acronyms (2-5 uppercase letters)
+    keywords.extend(_ACRONYM_RE.findall(text))
+
+    # Extract common programming languages and technologies in one pass
+    keywords.extend({_TECH_CANONICAL[m.lower()] for m in _TECH_RE.findall(text)})
+
+    # Remove duplicates and clean
+    return tuple(set([k.strip() for k in keywords if k.strip()]))
+
+
+# Deterministic, so full job descriptions are memoized
+_cached_additional_keywords = lru_cache(maxsize=128)(_additional_keywords)
+
 
 class JobDescriptionParser:
     """Parse job descriptions and extract requirements"""
 
     def __init__(self):
         self.llm = llm_service
+        self._cache: LRUCache = LRUCache(maxsize=JD_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(job_description: str, model: str) -> str:
+        """Hash of the job description and the model that parses it"""
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(model.encode())
+        digest.update(b"\0")
+        digest.update(job_description.encode())
+        return digest.hexdigest()
 
     def parse_job_description(self, job_description: str) -> JobRequirements:
         """
@@ -26,6 +143,15 @@ class JobDescriptionParser:
         Returns:
             JobRequirements object
         """
+        # The model goes into both the cache key and the LLM call
+        model = self.llm.text_model
+        key = self._cache_key(job_description, model)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            logger.info("Using cached job description parse")
+            return cached
+
         logger.info("Parsing job description")
 
         system_prompt = """You are an expert at analyzing job descriptions. Extract key requirements, skills, and qualifications accurately.
@@ -62,27 +188,37 @@ Return ONLY valid JSON, no additional text."""
 
         try:
             # Get structured response from LLM
-            structured_data = self.llm.generate_structured(
+            raw_response = self.llm.generate_structured_raw(
                 prompt=parsing_prompt,
                 system_prompt=system_prompt,
                 temperature=0.2,
+                model=model,
+                schema=JOB_SCHEMA,
             )
 
+            # Validate the JSON text directly; repair it only if that fails
+            try:
+                job_requirements = JobRequirements.model_validate_json(raw_response)
+            except ValidationError:
+                job_requirements = JobRequirements.model_validate(
+                    self.llm.parse_json(raw_response)
+                )
+
             # Additional keyword extraction
             additional_keywords = self._extract_additional_keywords(job_description)
 
             # Merge with LLM-extracted keywords
-            all_keywords = list(
-                set(structured_data.get("keywords", []) + additional_keywords)
+            job_requirements.keywords = list(
+                set(job_requirements.keywords + additional_keywords)
             )
-            structured_data["keywords"] = all_keywords
-
-            # Convert to JobRequirements object
-            job_requirements = JobRequirements(**structured_data)
 
             logger.info(
                 f"Successfully parsed job description. Found {len(job_requirements.keywords)} keywords"
             )
+
+            with self._cache_lock:
+                self._cache[key] = job_requirements
+
             return job_requirements
 
         except Exception as e:
@@ -99,75 +235,9 @@ Return ONLY valid JSON, no additional text."""
         Returns:
             List of keywords
         """
-        keywords = []
-
-        # Common skill patterns
-        skill_patterns = [
-            r'\b(?:proficient|experience|skilled|knowledge)\s+(?:in|with)\s+([\w\s\+\#\.]+)',
-            r'\b([\w\+\#]+)\s+(?:developer|engineer|specialist|expert)',
-            r'\b(?:using|including|such as)\s+([\w\s,\+\#\.]+)',
-        ]
-
-        for pattern in skill_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                keyword = match.group(1).strip()
-                if len(keyword) > 2 and len(keyword) < 50:
-                    keywords.append(keyword)
-
-        # Extract acronyms (2-5 uppercase letters)
-        acronyms = re.findall(r'\b[A-Z]{2,5}\b', text)
-        keywords.extend(acronyms)
-
-        # Extract common programming languages and technologies
-        tech_keywords = [
-            'Python',
-            'Java',
-            'JavaScript',
-            'C++',
-            'C#',
-            'Ruby',
-            'PHP',
-            'Swift',
-            'Kotlin',
-            'Go',
-            'Rust',
-            'TypeScript',
-            'SQL',
-            'NoSQL',
-            'React',
-            'Angular',
-            'Vue',
-            'Node.js',
-            'Django',
-            'Flask',
-            'Spring',
-            'AWS',
-            'Azure',
-            'GCP',
-            'Docker',
-            'Kubernetes',
-            'Git',
-            'CI/CD',
-            'Agile',
-            'Scrum',
-            'REST',
-            'GraphQL',
-            'Machine Learning',
-            'Deep Learning',
-            'AI',
-            'Data Science',
-            'DevOps',
-        ]
-
-        for tech in tech_keywords:
-            if re.search(r'\b' + re.escape(tech) + r'\b', text, re.IGNORECASE):
-                keywords.append(tech)
-
-        # Remove duplicates and clean
-        keywords = list(set([k.strip() for k in keywords if k.strip()]))
-
-        return keywords
+        if len(text) > KEYWORD_CACHE_MIN_LENGTH:
+            return list(_cached_additional_keywords(text))
+        return list(_additional_keywords(text))
 
     def calculate_keyword_match(
         self, resume_keywords: List[str], job_keywords: List[str]
@@ -182,9 +252,9 @@ Return ONLY valid JSON, no additional text."""
         Returns:
             Match analysis
         """
-        # Normalize keywords for comparison
-        resume_kw_lower = [kw.lower() for kw in resume_keywords]
-        job_kw_lower = [kw.lower() for kw in job_keywords]
+        # Normalize keywords for comparison (job keywords deduplicated, order kept)
+        resume_kw_lower = {kw.lower() for kw in resume_keywords}
+        job_kw_lower = list(dict.fromkeys(kw.lower() for kw in job_keywords))
 
         # Find matches
         matched = [kw for kw in job_kw_lower if kw in resume_kw_lower]
@@ -213,27 +283,16 @@ Return ONLY valid JSON, no additional text."""
             List of key phrases
         """
         # Simple phrase extraction using n-grams
-        words = re.findall(r'\b\w+\b', text.lower())
-
-        # Bigrams and trigrams
-        phrases = []
-        for i in range(len(words) - 1):
-            phrases.append(f"{words[i]} {words[i + 1]}")
-
-        for i in range(len(words) - 2):
-            phrases.append(f"{words[i]} {words[i + 1]} {words[i + 2]}")
-
-        # Count frequency
-        phrase_counts = {}
-        for phrase in phrases:
-            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+        words = _WORD_RE.findall(text.lower())
 
-        # Get top phrases
-        sorted_phrases = sorted(
-            phrase_counts.items(), key=lambda x: x[1], reverse=True
-        )
+        # Count bigrams and trigrams straight from generators; most_common
+        # keeps only the top_n phrases on a heap instead of sorting them all
+        phrase_counts = Counter(chain(
+            map(" ".join, zip(words, words[1:])),
+            map(" ".join, zip(words, words[1:], words[2:])),
+        ))
 
-        return [phrase for phrase, count in sorted_phrases[:top_n]]
+        return [phrase for phrase, count in phrase_counts.most_common(top_n)]
 
 
 # Global instance
@@ -1,14 +1,199 @@
 """
 LLM Service for interacting with Ollama models (gemma:2b and llama3.2-vision:11b)
 """
+import asyncio
+import functools
+import hashlib
+import httpx
 import requests
 import json
 import logging
-from typing import Dict, Any, Optional, List
+import orjson
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from app.config import settings
 
+try:
+    import json5  # Optional: lenient last-resort JSON parsing
+except ImportError:
+    json5 = None
+
 logger = logging.getLogger(__name__)
 
+# Patterns for locating JSON in malformed structured responses
+_MD_FENCE_RE = re.compile(r'```json\s*|\s*```')
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+_VALUE_START = frozenset('"{[')
+
+# Request bodies are pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# How long an /api/tags model list is reused, in seconds
+TAGS_TTL = 10
+
+# Minimum seconds between sweeps of expired LLM cache rows
+CACHE_PURGE_INTERVAL = 3600
+
+
+def _repair_json(text: str) -> str:
+    """
+    Fix common LLM JSON mistakes in a single pass over the text
+
+    Outside strings: drops trailing commas before } or ], collapses
+    repeated commas, and inserts a missing comma between a value and the
+    next string/object/array. Inside strings: replaces raw newlines and
+    other control characters with spaces.
+
+    Args:
+        text: JSON-like text
+
+    Returns:
+        Repaired text
+    """
+    out = []
+    in_string = False
+    escape = False
+    prev = ""  # last significant character emitted outside a string
+    prev_index = -1  # its position in out
+
+    for ch in text:
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+                prev, prev_index = ch, len(out)
+            elif ch < " ":
+                ch = " "
+            out.append(ch)
+            continue
+
+        if ch.isspace():
+            out.append(ch)
+            continue
+
+        if ch == ",":
+            if prev == ",":
+                continue
+        elif ch in "}]":
+            if prev == ",":
+                out[prev_index] = ""
+        elif ch in _VALUE_START and prev and (prev in '"}]' or prev.isalnum()):
+            out.append(",")
+
+        if ch == '"':
+            in_string = True
+        out.append(ch)
+        prev, prev_index = ch, len(out) - 1
+
+    return "".join(out)
+
+
+class _JsonCompletion:
+    """Track streamed JSON text and report when the top-level value closes"""
+
+    __slots__ = ("depth", "started", "in_string", "escape")
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk of text; True once brackets are balanced again"""
+        for ch in text:
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = True
+            elif ch in "{[":
+                self.depth += 1
+                self.started = True
+            elif ch in "}]":
+                self.depth -= 1
+                if self.started and self.depth <= 0:
+                    return True
+        return False
+
+
+class LLMCache:
+    """SQLite-backed cache of LLM responses, keyed by a hash of the request"""
+
+    def __init__(self, path: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Content hash of an Ollama request payload"""
+        return hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None if missing/expired"""
+        try:
+            with closing(sqlite3.connect(self.path, timeout=5)) as conn:
+                row = conn.execute(
+                    "SELECT response FROM llm_responses WHERE key = ? AND expires > ?",
+                    (key, time.time()),
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response for key, sweeping out expired rows now and then"""
+        now = time.time()
+        with self._lock:
+            purge = now - self._last_purge >= CACHE_PURGE_INTERVAL
+            if purge:
+                self._last_purge = now
+
+        try:
+            with closing(sqlite3.connect(self.path, timeout=5)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_responses "
+                    "(key TEXT PRIMARY KEY, response TEXT NOT NULL, expires REAL NOT NULL)"
+                )
+                if purge:
+                    # Expiry is only checked on read, so drop stale rows here
+                    conn.execute("DELETE FROM llm_responses WHERE expires <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, expires) VALUES (?, ?, ?)",
+                    (key, response, now + self.ttl),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist LLM cache entry: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters since startup"""
+        return {"hits": self.hits, "misses": self.misses}
+
 
 class OllamaService:
     """Service for interacting with Ollama API"""
@@ -19,6 +204,154 @@ class OllamaService:
         self.vision_model = settings.VISION_MODEL
         self.temperature = settings.TEMPERATURE
         self.max_tokens = settings.MAX_TOKENS
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tags_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self.cache: Optional[LLMCache] = (
+            LLMCache(os.path.join(settings.CACHE_DIR, "llm_cache.sqlite3"), settings.LLM_CACHE_TTL)
+            if settings.LLM_CACHE_ENABLED
+            else None
+        )
+
+        # Pooled keep-alive connections for the sync (worker-thread) calls.
+        # Retry only covers idempotent requests, so generations are never resent
+        self.session = requests.Session()
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared async HTTP client, keeping connections to Ollama alive between calls"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=120,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            )
+        return self._async_client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool for blocking LLM work, capped to what Ollama serves in parallel"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.LLM_POOL_SIZE, thread_name_prefix="llm"
+            )
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client, the sync session and the worker pool"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.session.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def arun_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking function that calls the LLM on the dedicated worker pool
+
+        Args:
+            func: Synchronous function to run
+            *args, **kwargs: Arguments passed to func
+
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    def _build_payload(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        format_json: bool = False,
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the request body for Ollama's /api/generate endpoint"""
+        payload = {
+            "model": model,
+            "prompt": prompt,
+            # JSON responses are streamed so reading can stop once the value closes
+            "stream": format_json,
+            "keep_alive": settings.OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": temperature or self.temperature,
+                "num_predict": self.max_tokens,
+                "num_ctx": settings.NUM_CTX,
+            },
+        }
+
+        if system_prompt:
+            payload["system"] = system_prompt
+
+        if format_json:
+            # A JSON Schema constrains decoding to that shape; "json" only to valid JSON
+            payload["format"] = schema or "json"
+
+        return payload
+
+    async def awarmup(self, model: str) -> None:
+        """Load a model into Ollama's memory (an empty prompt generates nothing)"""
+        # Same options as real requests: a different num_ctx would make
+        # Ollama reload the model on the first real call
+        payload = self._build_payload(model, "")
+        try:
+            logger.info(f"Warming up Ollama model: {model}")
+            response = await self.async_client.post(
+                "/api/generate",
+                content=orjson.dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=300,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not warm up model {model}: {str(e)}")
+
+    @staticmethod
+    def _read_stream_chunk(line: str, parts: List[str], tracker: _JsonCompletion) -> bool:
+        """Add one NDJSON stream line to parts; True when reading can stop"""
+        chunk = orjson.loads(line)
+        if "error" in chunk:
+            raise RuntimeError(f"Failed to call LLM: {chunk['error']}")
+
+        text = chunk.get("response", "")
+        parts.append(text)
+        return tracker.feed(text) or chunk.get("done", False)
+
+    @staticmethod
+    def _cacheable(result: str, complete: bool, format_json: bool) -> bool:
+        """Whether a response may be cached: a finished, non-empty reply that
+        parses as JSON when JSON was requested (failures must not be replayed)"""
+        if not complete or not result:
+            return False
+        if format_json:
+            try:
+                orjson.loads(result)
+            except orjson.JSONDecodeError:
+                return False
+        return True
+
+    def _cache_key(self, payload: Dict[str, Any], cache: bool = False) -> Optional[str]:
+        """Cache key for payload, or None if this request should not be cached"""
+        if self.cache is None:
+            return None
+        temperature = payload["options"]["temperature"]
+        if not cache and temperature > settings.LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        # Near-equal temperatures share entries
+        options = {**payload["options"], "temperature": round(temperature, 1)}
+        return LLMCache.make_key({**payload, "options": options})
 
     def _make_request(
         self,
@@ -27,6 +360,8 @@ class OllamaService:
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         format_json: bool = False,
+        schema: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
     ) -> str:
         """
         Make request to Ollama API
@@ -37,35 +372,49 @@ class OllamaService:
             system_prompt: System prompt
             temperature: Sampling temperature
             format_json: Whether to request JSON format
+            schema: Optional JSON Schema the JSON response must follow
+            cache: Cache the response even above LLM_CACHE_MAX_TEMPERATURE
 
         Returns:
             Model response text
         """
         url = f"{self.base_url}/api/generate"
+        payload = self._build_payload(
+            model, prompt, system_prompt, temperature, format_json, schema
+        )
 
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature or self.temperature,
-                "num_predict": self.max_tokens,
-            },
-        }
-
-        if system_prompt:
-            payload["system"] = system_prompt
+        cache_key = self._cache_key(payload, cache)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        if format_json:
-            payload["format"] = "json"
+        body = orjson.dumps(payload)
 
         try:
             logger.info(f"Making request to Ollama with model: {model}")
-            response = requests.post(url, json=payload, timeout=120)
-            response.raise_for_status()
-
-            result = response.json()
-            return result.get("response", "").strip()
+            if payload["stream"]:
+                parts: List[str] = []
+                tracker = _JsonCompletion()
+                with self.session.post(
+                    url, data=body, headers=JSON_HEADERS, stream=True, timeout=120
+                ) as response:
+                    response.raise_for_status()
+                    complete = False
+                    for line in response.iter_lines():
+                        if line and self._read_stream_chunk(line, parts, tracker):
+                            complete = True
+                            break
+                result = "".join(parts).strip()
+            else:
+                response = self.session.post(url, data=body, headers=JSON_HEADERS, timeout=120)
+                response.raise_for_status()
+
+                result = orjson.loads(response.content).get("response", "").strip()
+                complete = True
+            if cache_key and self._cacheable(result, complete, format_json):
+                self.cache.set(cache_key, result)
+            return result
 
         except requests.exceptions.Timeout:
             logger.error("Request to Ollama timed out")
@@ -74,12 +423,72 @@ class OllamaService:
             logger.error(f"Error calling Ollama API: {str(e)}")
             raise RuntimeError(f"Failed to call LLM: {str(e)}")
 
+    async def _amake_request(
+        self,
+        model: str,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        format_json: bool = False,
+        schema: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ) -> str:
+        """Async version of _make_request using the shared httpx client"""
+        payload = self._build_payload(
+            model, prompt, system_prompt, temperature, format_json, schema
+        )
+
+        # SQLite cache reads/writes block (connect, commit, fsync), so they run
+        # in a thread rather than stalling the event loop
+        cache_key = self._cache_key(payload, cache)
+        if cache_key:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        body = orjson.dumps(payload)
+
+        try:
+            logger.info(f"Making async request to Ollama with model: {model}")
+            if payload["stream"]:
+                parts: List[str] = []
+                tracker = _JsonCompletion()
+                async with self.async_client.stream(
+                    "POST", "/api/generate", content=body, headers=JSON_HEADERS
+                ) as response:
+                    response.raise_for_status()
+                    complete = False
+                    async for line in response.aiter_lines():
+                        if line and self._read_stream_chunk(line, parts, tracker):
+                            complete = True
+                            break
+                result = "".join(parts).strip()
+            else:
+                response = await self.async_client.post(
+                    "/api/generate", content=body, headers=JSON_HEADERS
+                )
+                response.raise_for_status()
+
+                result = orjson.loads(response.content).get("response", "").strip()
+                complete = True
+            if cache_key and self._cacheable(result, complete, format_json):
+                await asyncio.to_thread(self.cache.set, cache_key, result)
+            return result
+
+        except httpx.TimeoutException:
+            logger.error("Request to Ollama timed out")
+            raise TimeoutError("LLM request timed out")
+        except httpx.HTTPError as e:
+            logger.error(f"Error calling Ollama API: {str(e)}")
+            raise RuntimeError(f"Failed to call LLM: {str(e)}")
+
     def generate_text(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         model: Optional[str] = None,
+        cache: bool = False,
     ) -> str:
         """
         Generate text using text model
@@ -89,6 +498,7 @@ class OllamaService:
             system_prompt: System instruction
             temperature: Sampling temperature
             model: Optional model override (defaults to text_model)
+            cache: Cache the response even above LLM_CACHE_MAX_TEMPERATURE
 
         Returns:
             Generated text
@@ -98,6 +508,24 @@ class OllamaService:
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=temperature,
+            cache=cache,
+        )
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        model: Optional[str] = None,
+        cache: bool = False,
+    ) -> str:
+        """Async version of generate_text"""
+        return await self._amake_request(
+            model=model or self.text_model,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            cache=cache,
         )
 
     def generate_structured(
@@ -106,6 +534,8 @@ class OllamaService:
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = 0.3,
         model: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate structured JSON response using text model
@@ -115,64 +545,124 @@ class OllamaService:
             system_prompt: System instruction
             temperature: Sampling temperature (lower for structured output)
             model: Optional model override (defaults to text_model)
+            schema: Optional JSON Schema to constrain the response to
+            cache: Cache the response even above LLM_CACHE_MAX_TEMPERATURE
 
         Returns:
             Parsed JSON response
         """
-        response = self._make_request(
+        response = self.generate_structured_raw(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            model=model,
+            schema=schema,
+            cache=cache,
+        )
+        return self.parse_json(response)
+
+    def generate_structured_raw(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = 0.3,
+        model: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ) -> str:
+        """
+        Generate a JSON-format response and return it unparsed, so callers
+        can validate it straight into a schema (see parse_json for repairs)
+
+        Args:
+            prompt: User prompt
+            system_prompt: System instruction
+            temperature: Sampling temperature (lower for structured output)
+            model: Optional model override (defaults to text_model)
+            schema: Optional JSON Schema to constrain the response to
+            cache: Cache the response even above LLM_CACHE_MAX_TEMPERATURE
+
+        Returns:
+            Raw JSON response text
+        """
+        return self._make_request(
             model=model or self.text_model,
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=temperature,
             format_json=True,
+            schema=schema,
+            cache=cache,
         )
 
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = 0.3,
+        model: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Async version of generate_structured"""
+        response = await self._amake_request(
+            model=model or self.text_model,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            format_json=True,
+            schema=schema,
+            cache=cache,
+        )
+        return self.parse_json(response)
+
+    def parse_json(self, response: str) -> Dict[str, Any]:
+        """
+        Parse an LLM JSON response, repairing common formatting mistakes
+
+        Args:
+            response: Raw response text
+
+        Returns:
+            Parsed JSON response
+        """
         try:
-            return json.loads(response)
+            return orjson.loads(response)
         except json.JSONDecodeError as e:
             # Try to extract and fix JSON from response
             logger.warning(f"Failed to parse JSON: {str(e)}, attempting to fix")
-            import re
 
-            # Remove markdown code blocks if present
-            cleaned = re.sub(r'```json\s*|\s*```', '', response)
+            # Fences wrap the whole response in the common case: strip them
+            # with string ops before running any regex over the text
+            cleaned = response.strip()
+            if cleaned.startswith('```'):
+                cleaned = cleaned.split('\n', 1)[1] if '\n' in cleaned else cleaned[3:]
+            if cleaned.endswith('```'):
+                cleaned = cleaned[:-3]
             cleaned = cleaned.strip()
 
+            try:
+                return orjson.loads(cleaned)
+            except json.JSONDecodeError:
+                # Remove markdown code blocks anywhere in the response
+                cleaned = _MD_FENCE_RE.sub('', response).strip()
+
             # Try parsing cleaned response
             try:
-                return json.loads(cleaned)
+                return orjson.loads(cleaned)
             except json.JSONDecodeError:
                 # Extract JSON object
-                json_match = re.search(r'\{.*\}', cleaned, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(cleaned)
                 if json_match:
                     try:
                         json_str = json_match.group()
 
-                        # Apply multiple JSON fixes
-                        # 1. Remove trailing commas before } or ]
-                        json_str = re.sub(r',(\s*[}\]])', r'\1', json_str)
-
-                        # 2. Fix missing commas after ] followed by }
-                        json_str = re.sub(r'(\])\s*\n\s*(\})', r'\1,\2', json_str)
-
-                        # 3. Fix missing commas after ] followed by "
-                        json_str = re.sub(r'(\])\s*\n\s*(")', r'\1,\2', json_str)
-
-                        # 4. Fix missing commas after } followed by {
-                        json_str = re.sub(r'(\})\s*\n\s*(\{)', r'\1,\2', json_str)
-
-                        # 5. Fix missing commas after } followed by "
-                        json_str = re.sub(r'(\})\s*\n\s*(")', r'\1,\2', json_str)
-
-                        # 6. Remove newlines within string values
-                        json_str = re.sub(r':\s*"([^"]*)\n([^"]*)"', r': "\1 \2"', json_str)
-
-                        # 7. Fix multiple consecutive commas
-                        json_str = re.sub(r',\s*,', ',', json_str)
+                        # Fix commas and raw newlines in one pass
+                        json_str = _repair_json(json_str)
 
                         # 5. Try to use a more lenient JSON parser
                         try:
-                            return json.loads(json_str)
+                            return orjson.loads(json_str)
                         except json.JSONDecodeError:
                             # Last resort: try to manually fix the JSON structure
                             # Log the problematic part
@@ -180,13 +670,11 @@ class OllamaService:
                             logger.error(f"Last 500 chars: {json_str[-500:]}")
 
                             # Try json5 library if available (more lenient)
-                            try:
-                                import json5
-                                return json5.loads(json_str)
-                            except ImportError:
-                                pass
-                            except Exception as e3:
-                                logger.error(f"json5 also failed: {str(e3)}")
+                            if json5 is not None:
+                                try:
+                                    return json5.loads(json_str)
+                                except Exception as e3:
+                                    logger.error(f"json5 also failed: {str(e3)}")
 
                             raise ValueError(f"Failed to parse LLM response as JSON after all fixes. Error: {str(e)}")
 
@@ -222,6 +710,35 @@ class OllamaService:
             system_prompt=system_prompt,
         )
 
+    async def aanalyze_with_vision(
+        self,
+        prompt: str,
+        image_path: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Async version of analyze_with_vision"""
+        return await self._amake_request(
+            model=self.vision_model,
+            prompt=prompt,
+            system_prompt=system_prompt,
+        )
+
+    def _cached_tags(self) -> Optional[List[Dict[str, Any]]]:
+        """Model list from a recent /api/tags call, if still fresh"""
+        if self._tags_cache and time.monotonic() - self._tags_cache[0] < TAGS_TTL:
+            return self._tags_cache[1]
+        return None
+
+    def _get_tags(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Fetch raw model list from Ollama's /api/tags endpoint (briefly cached)"""
+        models = None if refresh else self._cached_tags()
+        if models is None:
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=10)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+            self._tags_cache = (time.monotonic(), models)
+        return models
+
     def check_model_availability(self, model_name: str) -> bool:
         """
         Check if a model is available in Ollama
@@ -233,12 +750,7 @@ class OllamaService:
             True if model is available
         """
         try:
-            url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            models = response.json().get("models", [])
-            available_models = [m.get("name", "") for m in models]
+            available_models = [m.get("name", "") for m in self._get_tags()]
 
             return model_name in available_models
 
@@ -253,24 +765,24 @@ class OllamaService:
         Returns:
             Dictionary with model availability status
         """
+        # Both checks are answered from the same (cached) tags call
         return {
             "text_model": self.check_model_availability(self.text_model),
             "vision_model": self.check_model_availability(self.vision_model),
         }
 
-    def get_available_models(self) -> List[Dict[str, Any]]:
+    def get_available_models(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get list of all available Ollama models
 
+        Args:
+            refresh: Bypass the short-lived model list cache
+
         Returns:
             List of available models with metadata
         """
         try:
-            url = f"{self.base_url}/api/tags"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            models = response.json().get("models", [])
+            models = self._get_tags(refresh)
 
             # Format model information
             formatted_models = []
@@ -287,6 +799,46 @@ class OllamaService:
             logger.error(f"Error fetching available models: {str(e)}")
             return []
 
+    async def _afetch_models(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Async version of _get_tags, sharing its cache"""
+        models = None if refresh else self._cached_tags()
+        if models is None:
+            response = await self.async_client.get("/api/tags", timeout=10)
+            response.raise_for_status()
+            models = response.json().get("models", [])
+            self._tags_cache = (time.monotonic(), models)
+        return models
+
+    async def averify_models(self) -> Dict[str, bool]:
+        """Async version of verify_models, using a single /api/tags call"""
+        try:
+            available_models = {m.get("name", "") for m in await self._afetch_models()}
+        except Exception as e:
+            logger.error(f"Error checking model availability: {str(e)}")
+            available_models = set()
+
+        return {
+            "text_model": self.text_model in available_models,
+            "vision_model": self.vision_model in available_models,
+        }
+
+    async def aget_available_models(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """Async version of get_available_models"""
+        try:
+            models = await self._afetch_models(refresh)
+            return [
+                {
+                    "name": model.get("name", ""),
+                    "size": model.get("size", 0),
+                    "modified": model.get("modified_at", ""),
+                }
+                for model in models
+            ]
+
+        except Exception as e:
+            logger.error(f"Error fetching available models: {str(e)}")
+            return []
+
 
 # Global instance
 llm_service = OllamaService()
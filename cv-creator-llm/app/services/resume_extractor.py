@@ -1,58 +1,24 @@
 """
 Resume data extraction service using LLM
 """
+import asyncio
 import json
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from app.config import settings, model_state
 from app.services.llm_service import llm_service
-from app.models.schemas import ResumeData, PersonalInfo, Education, Experience, Project, Certification
+from app.models.schemas import ResumeData, llm_output_schema
 from app.utils.document_extractor import extract_contact_info
 
 logger = logging.getLogger(__name__)
 
-
-class ResumeExtractor:
-    """Extract structured data from resume text using LLM"""
-
-    def __init__(self):
-        self.llm = llm_service
-
-    def extract_resume_data(self, resume_text: str) -> ResumeData:
-        """
-        Extract structured resume data from raw text
-
-        Args:
-            resume_text: Raw resume text
-
-        Returns:
-            Structured ResumeData object
-        """
-        logger.info("Extracting structured data from resume")
-
-        # Extract contact info using regex first
-        contact_info = extract_contact_info(resume_text)
-
-        # Use LLM to extract structured information
-        system_prompt = """You are an expert resume parser. Extract structured information from resumes accurately.
-CRITICAL: You MUST respond with ONLY valid JSON. No explanations, no markdown, no extra text.
-Ensure all JSON is properly formatted with correct quotes, commas, and brackets.
-Be thorough and capture all relevant details."""
-
-        extraction_prompt = f"""Extract ALL information from this resume comprehensively and return it as JSON.
-
-IMPORTANT:
-- Extract EVERY detail - do not skip or summarize anything
-- Capture ALL bullet points, achievements, responsibilities completely
-- Include ALL skills, certifications, languages mentioned
-- Preserve exact wording and details from the resume
-- Read the ENTIRE resume from start to finish
-
-Resume Text:
-{resume_text}
-
-Extract and return JSON with this EXACT structure:
-{{
-    "personal_info": {{
+# Independent extraction sections: name -> (keys it fills, JSON structure).
+# Each is sent as its own smaller prompt so they can run concurrently
+SECTION_PROMPTS = {
+    "profile": (
+        ("personal_info", "summary", "languages", "achievements"),
+        """{
+    "personal_info": {
         "name": "full name exactly as written",
         "email": "email address",
         "phone": "phone number with format",
@@ -60,92 +26,218 @@ Extract and return JSON with this EXACT structure:
         "linkedin": "full LinkedIn URL",
         "github": "full GitHub URL",
         "website": "personal website URL"
-    }},
+    },
     "summary": "complete professional summary or objective - extract word-for-word",
+    "languages": ["ALL languages with proficiency level if mentioned"],
+    "achievements": ["ALL general achievements, awards, honors not tied to a job, degree or project"]
+}""",
+    ),
+    "education": (
+        ("education",),
+        """{
     "education": [
-        {{
+        {
             "institution": "exact institution name",
             "degree": "exact degree name",
             "field_of_study": "specific major/specialization",
             "start_date": "month year or year",
             "end_date": "month year or 'Present'",
             "gpa": "exact GPA score if mentioned",
-            "achievements": ["ALL academic achievements, honors, awards - extract every single one"]
-        }}
-    ],
+            "achievements": ["ALL academic achievements, honors, awards"]
+        }
+    ]
+}""",
+    ),
+    "experience": (
+        ("experience",),
+        """{
     "experience": [
-        {{
+        {
             "company": "exact company name",
             "position": "exact job title",
             "location": "city, state/country",
             "start_date": "month year",
             "end_date": "month year or 'Present'",
             "current": true or false,
-            "responsibilities": ["Extract EVERY responsibility/duty listed - include all bullet points"],
-            "achievements": ["Extract EVERY achievement, result, metric, award - do not skip any"]
-        }}
-    ],
-    "skills": ["Extract EVERY skill mentioned - technical, soft skills, tools, technologies, frameworks, languages, etc. - be exhaustive"],
+            "responsibilities": ["EVERY responsibility/duty listed - include all bullet points"],
+            "achievements": ["EVERY achievement, result, metric, award"]
+        }
+    ]
+}""",
+    ),
+    "skills": (
+        ("skills",),
+        """{
+    "skills": ["EVERY skill mentioned - technical, soft skills, tools, technologies, frameworks, languages, etc."]
+}""",
+    ),
+    "projects": (
+        ("projects",),
+        """{
     "projects": [
-        {{
+        {
             "name": "exact project name",
             "description": "complete project description with all details",
             "technologies": ["ALL technologies, tools, frameworks used"],
             "link": "project URL/GitHub if available",
-            "achievements": ["project outcomes, metrics, recognition - extract all"]
-        }}
-    ],
+            "achievements": ["project outcomes, metrics, recognition"]
+        }
+    ]
+}""",
+    ),
+    "certifications": (
+        ("certifications",),
+        """{
     "certifications": [
-        {{
+        {
             "name": "exact certification name",
             "issuer": "issuing organization",
             "date": "completion/issue date if mentioned",
             "description": "brief description or focus area if mentioned"
-        }}
-    ],
-    "languages": ["Extract ALL languages with proficiency level if mentioned"],
-    "achievements": ["Extract ALL general achievements, awards, honors not covered in other sections"]
-}}
-
-CRITICAL INSTRUCTIONS:
-1. Read the ENTIRE resume - do not stop early
-2. Extract EVERYTHING - be thorough and complete
-3. Do not summarize or paraphrase - extract exact content
-4. Include ALL bullet points under each section
-5. Capture ALL skills, even if there are many
-6. If a field is truly not present, use null or [] as appropriate
-7. Ensure all arrays have ALL items, not just examples
+        }
+    ]
+}""",
+    ),
+}
+
+
+# Section prompts are static apart from the resume text, which goes last
+SECTION_SYSTEM_PROMPT = """You are an expert resume parser. Extract structured information from resumes accurately.
+CRITICAL: You MUST respond with ONLY valid JSON. No explanations, no markdown, no extra text."""
+
+SECTION_PREAMBLES = {
+    name: f"""Extract the {name.replace("_", " ")} section of the resume below and return it as JSON.
+
+Return JSON with this EXACT structure:
+{structure}
+
+Extract EVERY detail for this section exactly as written - do not skip, summarize or paraphrase.
+If a field is truly not present, use null or [] as appropriate."""
+    for name, (_, structure) in SECTION_PROMPTS.items()
+}
+
+# Output schemas that constrain each section's JSON
+SECTION_SCHEMAS = {
+    name: llm_output_schema(ResumeData, keys) for name, (keys, _) in SECTION_PROMPTS.items()
+}
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English text)"""
+    return len(text) // 4
+
+
+def _fit_to_token_budget(text: str, max_tokens: int) -> str:
+    """Trim text to about max_tokens, keeping its head and tail (cut at line breaks or spaces)"""
+    if _estimate_tokens(text) <= max_tokens:
+        return text
+
+    budget = max_tokens * 4
+    # Most of the budget goes to the head (contact details, summary, recent roles)
+    head = text[: budget * 3 // 4]
+    tail = text[len(text) - budget // 4:]
+    # Uploaded text has been through clean_text, which collapses newlines, so
+    # fall back to cutting between words
+    cut = head.rfind("\n")
+    if cut <= 0:
+        cut = head.rfind(" ")
+    if cut > 0:
+        head = head[:cut]
+    start = tail.find("\n")
+    if start == -1:
+        start = tail.find(" ")
+    tail = tail[start + 1:]
+    logger.warning(
+        f"Resume text (~{_estimate_tokens(text)} tokens) exceeds the "
+        f"{max_tokens} token budget; truncating"
+    )
+    return f"{head}\n...\n{tail}"
 
-Return ONLY valid JSON with NO additional text before or after."""
 
-        try:
-            # Import settings to get parsing model
-            from app.config import settings
-
-            # Get structured response from LLM using parsing model
-            structured_data = self.llm.generate_structured(
-                prompt=extraction_prompt,
-                system_prompt=system_prompt,
-                temperature=0.2,  # Low temperature for consistent extraction
-                model=settings.PARSING_MODEL,
-            )
+class ResumeExtractor:
+    """Extract structured data from resume text using LLM"""
+
+    def __init__(self):
+        self.llm = llm_service
+
+    async def aextract_resume_data(self, resume_text: str) -> Tuple[ResumeData, List[str]]:
+        """
+        Extract structured resume data from raw text, with one concurrent
+        LLM call per section in SECTION_PROMPTS
+
+        A failed profile section fails the extraction; any other failed
+        section is left empty and reported back to the caller.
+
+        Args:
+            resume_text: Raw resume text
+
+        Returns:
+            Tuple of (ResumeData, names of sections that could not be extracted)
+        """
+        logger.info("Extracting structured data from resume by section")
 
-            # Merge regex-extracted contact info with LLM extracted data
-            if "personal_info" in structured_data:
-                for key, value in contact_info.items():
-                    if value and not structured_data["personal_info"].get(key):
-                        structured_data["personal_info"][key] = value
+        contact_info = extract_contact_info(resume_text)
+        prompt_text = _fit_to_token_budget(resume_text, settings.MAX_INPUT_TOKENS)
+
+        results = await asyncio.gather(
+            *(self._aextract_section(name, prompt_text) for name in SECTION_PROMPTS),
+            return_exceptions=True,
+        )
+
+        structured_data: Dict[str, Any] = {}
+        skipped: List[str] = []
+        for name, result in zip(SECTION_PROMPTS, results):
+            if isinstance(result, Exception):
+                # Without the profile there is no name, so the resume is unusable
+                if name == "profile":
+                    logger.error(f"Error extracting resume data: {str(result)}")
+                    raise ValueError(f"Failed to extract resume data: {str(result)}")
+                logger.warning(f"Skipping resume section '{name}': {str(result)}")
+                skipped.append(name)
+                continue
+            structured_data.update(result)
 
-            # Convert to ResumeData object
-            resume_data = self._parse_resume_data(structured_data)
+        try:
+            resume_data = self._merge_and_parse(structured_data, contact_info)
 
             logger.info("Successfully extracted resume data")
-            return resume_data
+            return resume_data, skipped
 
         except Exception as e:
             logger.error(f"Error extracting resume data: {str(e)}")
             raise ValueError(f"Failed to extract resume data: {str(e)}")
 
+    async def _aextract_section(self, name: str, resume_text: str) -> Dict[str, Any]:
+        """Extract one SECTION_PROMPTS section, keeping only the keys it owns"""
+        keys = SECTION_PROMPTS[name][0]
+
+        section_prompt = f"""{SECTION_PREAMBLES[name]}
+
+Resume Text:
+{resume_text}
+
+Return ONLY valid JSON with NO additional text before or after."""
+
+        data = await self.llm.agenerate_structured(
+            prompt=section_prompt,
+            system_prompt=SECTION_SYSTEM_PROMPT,
+            temperature=0.2,
+            model=model_state.parsing,
+            schema=SECTION_SCHEMAS[name],
+        )
+        return {key: data[key] for key in keys if key in data}
+
+    def _merge_and_parse(
+        self, structured_data: Dict[str, Any], contact_info: Dict[str, Any]
+    ) -> ResumeData:
+        """Merge regex-extracted contact info into LLM data and build ResumeData"""
+        if "personal_info" in structured_data:
+            for key, value in contact_info.items():
+                if value and not structured_data["personal_info"].get(key):
+                    structured_data["personal_info"][key] = value
+
+        return self._parse_resume_data(structured_data)
+
     def _parse_resume_data(self, data: Dict[str, Any]) -> ResumeData:
         """
         Parse dictionary to ResumeData object
@@ -157,46 +249,25 @@ Return ONLY valid JSON with NO additional text before or after."""
             ResumeData object
         """
         try:
-            # Parse personal info
-            personal_info_data = data.get("personal_info", {})
-            personal_info = PersonalInfo(**personal_info_data)
-
-            # Parse education
-            education = []
-            for edu in data.get("education", []):
-                education.append(Education(**edu))
-
-            # Parse experience
-            experience = []
-            for exp in data.get("experience", []):
-                experience.append(Experience(**exp))
-
-            # Parse projects
-            projects = []
-            for proj in data.get("projects", []):
-                projects.append(Project(**proj))
-
-            # Parse certifications
-            certifications = []
-            for cert in data.get("certifications", []):
-                if isinstance(cert, str):
-                    # Handle legacy string format
-                    certifications.append(Certification(name=cert))
-                elif isinstance(cert, dict):
-                    certifications.append(Certification(**cert))
-
-            # Create ResumeData object
-            resume_data = ResumeData(
-                personal_info=personal_info,
-                summary=data.get("summary"),
-                education=education,
-                experience=experience,
-                skills=data.get("skills", []),
-                projects=projects if projects else None,
-                certifications=certifications if certifications else None,
-                languages=data.get("languages"),
-                achievements=data.get("achievements"),
-            )
+            # Handle legacy string format for certifications
+            certifications = [
+                {"name": cert} if isinstance(cert, str) else cert
+                for cert in data.get("certifications", [])
+                if isinstance(cert, (str, dict))
+            ]
+
+            # Validate the whole structure in one pass
+            resume_data = ResumeData.model_validate({
+                "personal_info": data.get("personal_info", {}),
+                "summary": data.get("summary"),
+                "education": data.get("education", []),
+                "experience": data.get("experience", []),
+                "skills": data.get("skills", []),
+                "projects": data.get("projects") or None,
+                "certifications": certifications or None,
+                "languages": data.get("languages"),
+                "achievements": data.get("achievements"),
+            })
 
             return resume_data
 
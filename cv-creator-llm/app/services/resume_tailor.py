@@ -1,8 +1,11 @@
 """
 Resume tailoring service - Core engine for customizing resumes for specific jobs
 """
+import asyncio
 import logging
+import re
 import copy
+from itertools import chain
 from typing import Dict, Any, List
 from app.services.llm_service import llm_service
 from app.models.schemas import (
@@ -12,10 +15,40 @@ from app.models.schemas import (
     ATSAnalysis,
 )
 from app.services.job_parser import job_parser
-from app.config import settings
+from app.config import model_state
+from app.utils import match_keywords
 
 logger = logging.getLogger(__name__)
 
+# Required skills that "balanced" tailoring may add when missing (substring match)
+_TRANSFERABLE_SKILL_RE = re.compile(
+    "agile|scrum|git|communication|leadership|python|java|sql|aws"
+)
+
+
+def _bullets_schema(min_items: int, max_items: int) -> Dict[str, Any]:
+    """JSON Schema for a {"bullets": [...]} rewrite of min_items-max_items strings"""
+    return {
+        "type": "object",
+        "properties": {
+            "bullets": {
+                "type": "array",
+                "items": {"type": "string"},
+                "minItems": min_items,
+                "maxItems": max_items,
+            },
+        },
+        "required": ["bullets"],
+    }
+
+
+# Constrained output for experience bullet rewrites, per optimization level
+BULLETS_SCHEMAS = {
+    "minimal": _bullets_schema(4, 5),
+    "balanced": _bullets_schema(4, 6),
+    "aggressive": _bullets_schema(5, 7),
+}
+
 
 class ResumeTailor:
     """Tailor resumes to match specific job requirements"""
@@ -23,14 +56,15 @@ class ResumeTailor:
     def __init__(self):
         self.llm = llm_service
 
-    def tailor_resume(
+    async def atailor_resume(
         self,
         resume_data: ResumeData,
         job_requirements: JobRequirements,
         optimization_level: str = "balanced",
     ) -> TailoredResume:
         """
-        Tailor resume to match job requirements
+        Tailor resume to match job requirements. The summary, experience and
+        project rewrites are independent, so their LLM calls run concurrently
 
         Args:
             resume_data: Original resume data
@@ -42,27 +76,44 @@ class ResumeTailor:
         """
         logger.info(f"Tailoring resume with {optimization_level} optimization")
 
-        # Create a deep copy to avoid modifying the original
-        tailored_data = resume_data.copy(deep=True)
+        # Copy what tailoring (and later revisions) reassign, so the original is
+        # untouched; personal info and education are never modified and are shared
+        tailored_data = resume_data.model_copy(update={
+            "experience": [exp.model_copy() for exp in resume_data.experience],
+            "skills": list(resume_data.skills),
+            "projects": (
+                [proj.model_copy() for proj in resume_data.projects]
+                if resume_data.projects
+                else resume_data.projects
+            ),
+        })
 
         customizations = []
+        had_summary = bool(tailored_data.summary)
 
-        # 1. Generate tailored professional summary
-        if not tailored_data.summary:
-            tailored_data.summary = self._generate_summary(
-                tailored_data, job_requirements
-            )
-            customizations.append("Generated professional summary aligned with job role")
+        # Rewrite the summary (1), experience (2) and projects (4) concurrently
+        if had_summary:
+            summary_task = self._aoptimize_summary(tailored_data.summary, job_requirements)
         else:
-            tailored_data.summary = self._optimize_summary(
-                tailored_data.summary, job_requirements
-            )
+            summary_task = self._agenerate_summary(tailored_data, job_requirements)
+
+        summary, experience, projects = await asyncio.gather(
+            summary_task,
+            self._aoptimize_experience(
+                tailored_data.experience, job_requirements, optimization_level
+            ),
+            self._aoptimize_projects(tailored_data.projects, job_requirements),
+        )
+
+        # 1. Professional summary
+        tailored_data.summary = summary
+        if had_summary:
             customizations.append("Optimized professional summary with job keywords")
+        else:
+            customizations.append("Generated professional summary aligned with job role")
 
-        # 2. Optimize experience descriptions
-        tailored_data.experience = self._optimize_experience(
-            tailored_data.experience, job_requirements, optimization_level
-        )
+        # 2. Experience descriptions
+        tailored_data.experience = experience
         customizations.append(
             f"Enhanced {len(tailored_data.experience)} work experience entries"
         )
@@ -73,11 +124,9 @@ class ResumeTailor:
         )
         customizations.append("Reordered skills to prioritize job-relevant keywords")
 
-        # 4. Optimize projects if present
+        # 4. Projects, if present
         if tailored_data.projects:
-            tailored_data.projects = self._optimize_projects(
-                tailored_data.projects, job_requirements
-            )
+            tailored_data.projects = projects
             customizations.append("Enhanced project descriptions with relevant keywords")
 
         # 5. Calculate ATS score and analysis
@@ -95,7 +144,7 @@ class ResumeTailor:
             relevance_score=relevance_score,
         )
 
-    def _generate_summary(
+    async def _agenerate_summary(
         self, resume_data: ResumeData, job_requirements: JobRequirements
     ) -> str:
         """Generate professional summary aligned with job"""
@@ -108,12 +157,9 @@ class ResumeTailor:
         )
         skills_summary = ", ".join(resume_data.skills[:10])
 
-        prompt = f"""Create a compelling professional summary for this candidate applying to: {job_requirements.job_title}
-
-Candidate Background:
-- Recent Experience: {experience_summary}
-- Key Skills: {skills_summary}
-- Education: {resume_data.education[0].degree if resume_data.education else 'Not specified'}
+        # Job-specific instructions first and the candidate last, so prompts for
+        # the same job share a prefix Ollama can reuse from its KV cache
+        prompt = f"""Create a compelling professional summary for a candidate applying to: {job_requirements.job_title}
 
 Job Requirements:
 - Required Skills: {', '.join(job_requirements.required_skills[:10])}
@@ -125,27 +171,30 @@ Write a 3-4 sentence professional summary that:
 3. Emphasizes value proposition for this specific role
 4. Uses strong action words and quantifiable achievements if possible
 
+Candidate Background:
+- Recent Experience: {experience_summary}
+- Key Skills: {skills_summary}
+- Education: {resume_data.education[0].degree if resume_data.education else 'Not specified'}
+
 Return ONLY the professional summary text, no additional commentary."""
 
         try:
-            summary = self.llm.generate_text(
+            summary = await self.llm.agenerate_text(
                 prompt=prompt, system_prompt=system_prompt, temperature=0.7,
-                model=settings.GENERATION_MODEL
+                model=model_state.generation, cache=True
             )
             return summary.strip()
         except Exception as e:
             logger.error(f"Error generating summary: {str(e)}")
             return f"Experienced professional with expertise in {', '.join(resume_data.skills[:5])}."
 
-    def _optimize_summary(self, original_summary: str, job_requirements: JobRequirements) -> str:
+    async def _aoptimize_summary(self, original_summary: str, job_requirements: JobRequirements) -> str:
         """Optimize existing summary for job"""
 
         system_prompt = """You are an expert resume writer. Optimize professional summaries to include relevant keywords while maintaining natural flow and authenticity."""
 
-        prompt = f"""Optimize this professional summary for a {job_requirements.job_title} position:
-
-Original Summary:
-{original_summary}
+        # Job-specific instructions first, the candidate's summary last
+        prompt = f"""Optimize the professional summary below for a {job_requirements.job_title} position.
 
 Job Requirements:
 - Required Skills: {', '.join(job_requirements.required_skills[:10])}
@@ -158,19 +207,22 @@ Rewrite the summary to:
 4. Make it ATS-friendly with exact keyword matches
 5. Emphasize experience relevant to this role
 
+Original Summary:
+{original_summary}
+
 Return ONLY the optimized summary, no additional text."""
 
         try:
-            optimized = self.llm.generate_text(
+            optimized = await self.llm.agenerate_text(
                 prompt=prompt, system_prompt=system_prompt, temperature=0.6,
-                model=settings.GENERATION_MODEL
+                model=model_state.generation, cache=True
             )
             return optimized.strip()
         except Exception as e:
             logger.error(f"Error optimizing summary: {str(e)}")
             return original_summary
 
-    def _optimize_experience(
+    async def _aoptimize_experience(
         self, experiences: List, job_requirements: JobRequirements, optimization_level: str
     ) -> List:
         """Optimize work experience descriptions based on optimization level"""
@@ -181,27 +233,22 @@ Return ONLY the optimized summary, no additional text."""
             experience_limit = 2  # Only optimize first 2 jobs
             num_bullets = "4-5"
             temperature = 0.7
+            schema = BULLETS_SCHEMAS["minimal"]
         elif optimization_level == "aggressive":
             system_prompt = """You are an expert ATS optimizer. Aggressively rewrite bullet points to maximize keyword matching and impact. Include as many relevant job keywords as naturally possible."""
             experience_limit = len(experiences)  # Optimize all
             num_bullets = "5-7"
             temperature = 0.5
+            schema = BULLETS_SCHEMAS["aggressive"]
         else:  # balanced
             system_prompt = """You are an expert at writing impactful, ATS-optimized resume bullet points. Use strong action verbs, include quantifiable achievements, and incorporate relevant keywords naturally."""
             experience_limit = min(3, len(experiences))  # Optimize first 3
             num_bullets = "4-6"
             temperature = 0.6
+            schema = BULLETS_SCHEMAS["balanced"]
 
-        for i, exp in enumerate(experiences):
-            # Limit based on optimization level
-            if i >= experience_limit:
-                continue
-
-            prompt = f"""Optimize these work responsibilities for a {job_requirements.job_title} position:
-
-Position: {exp.position} at {exp.company}
-Original Responsibilities:
-{chr(10).join(['- ' + resp for resp in exp.responsibilities])}
+        # Every entry shares the job-specific instructions as its prompt prefix
+        instructions = f"""Optimize the work responsibilities below for a {job_requirements.job_title} position.
 
 Job Requirements:
 - Required Skills: {', '.join(job_requirements.required_skills[:8])}
@@ -215,23 +262,38 @@ Rewrite responsibilities to:
 5. Keep each bullet point concise (1-2 lines)
 6. Return {num_bullets} most impactful bullet points
 
-Return as a JSON array of strings: ["bullet 1", "bullet 2", ...]
-Return ONLY the JSON array."""
+Return JSON: {{"bullets": ["bullet 1", "bullet 2", ...]}}"""
+
+        prompts = [
+            f"""{instructions}
+
+Position: {exp.position} at {exp.company}
+Original Responsibilities:
+{chr(10).join(['- ' + resp for resp in exp.responsibilities])}
+
+Return ONLY the JSON object."""
+            # Limit based on optimization level
+            for exp in experiences[:experience_limit]
+        ]
 
-            try:
-                optimized = self.llm.generate_structured(
+        results = await asyncio.gather(
+            *(
+                self.llm.agenerate_structured(
                     prompt=prompt, system_prompt=system_prompt, temperature=temperature,
-                    model=settings.GENERATION_MODEL
+                    model=model_state.generation, schema=schema, cache=True
                 )
+                for prompt in prompts
+            ),
+            return_exceptions=True,
+        )
 
-                if isinstance(optimized, list):
-                    exp.responsibilities = optimized
-                elif isinstance(optimized, dict) and "bullets" in optimized:
-                    exp.responsibilities = optimized["bullets"]
-
-            except Exception as e:
-                logger.warning(f"Error optimizing experience {i}: {str(e)}")
-                continue
+        for i, (exp, optimized) in enumerate(zip(experiences, results)):
+            if isinstance(optimized, Exception):
+                logger.warning(f"Error optimizing experience {i}: {str(optimized)}")
+            elif isinstance(optimized, dict) and "bullets" in optimized:
+                exp.responsibilities = optimized["bullets"]
+            elif isinstance(optimized, list):
+                exp.responsibilities = optimized
 
         return experiences
 
@@ -242,7 +304,8 @@ Return ONLY the JSON array."""
 
         # Combine required and preferred skills
         job_skills = job_requirements.required_skills + job_requirements.preferred_skills
-        job_skills_lower = [s.lower() for s in job_skills]
+        job_skills_lower = {s.lower() for s in job_skills}
+        skills_lower = {s.lower() for s in skills}
 
         # Separate matching and non-matching skills
         matching_skills = []
@@ -255,47 +318,44 @@ Return ONLY the JSON array."""
                 other_skills.append(skill)
 
         # Add missing required skills based on optimization level
-        additional_skills = []
-
         if optimization_level == "minimal":
             # Only add exact matches from required skills
-            for req_skill in job_requirements.required_skills[:3]:
-                if req_skill.lower() not in [s.lower() for s in skills]:
-                    additional_skills.append(req_skill)
+            candidates = job_requirements.required_skills[:3]
         elif optimization_level == "aggressive":
             # Add all missing required and some preferred skills
-            for req_skill in job_requirements.required_skills + job_requirements.preferred_skills[:5]:
-                if req_skill.lower() not in [s.lower() for s in skills]:
-                    additional_skills.append(req_skill)
+            candidates = job_requirements.required_skills + job_requirements.preferred_skills[:5]
         else:  # balanced
-            # Add missing required skills if they seem transferable
-            for req_skill in job_requirements.required_skills:
-                if req_skill.lower() not in [s.lower() for s in skills]:
-                    # Only add if it's a common/transferable skill
-                    if any(
-                        keyword in req_skill.lower()
-                        for keyword in ["agile", "scrum", "git", "communication", "leadership", "python", "java", "sql", "aws"]
-                    ):
-                        additional_skills.append(req_skill)
+            # Add missing required skills only if it's a common/transferable skill
+            candidates = [
+                req_skill for req_skill in job_requirements.required_skills
+                if _TRANSFERABLE_SKILL_RE.search(req_skill.lower())
+            ]
+
+        # Missing skills, once each regardless of case
+        additional_skills: Dict[str, str] = {}
+        for req_skill in candidates:
+            key = req_skill.lower()
+            if key not in skills_lower:
+                additional_skills.setdefault(key, req_skill)
 
         # Combine: matching skills first, then other skills, then additional
-        optimized_skills = matching_skills + other_skills + additional_skills
+        optimized_skills = list(dict.fromkeys(
+            matching_skills + other_skills + list(additional_skills.values())
+        ))
 
         # Limit based on optimization level
         max_skills = 35 if optimization_level == "aggressive" else 30
         return optimized_skills[:max_skills]
 
-    def _optimize_projects(self, projects: List, job_requirements: JobRequirements) -> List:
+    async def _aoptimize_projects(self, projects: List, job_requirements: JobRequirements) -> List:
         """Optimize project descriptions"""
+        if not projects:
+            return projects
 
-        for proj in projects[:3]:  # Focus on top 3 projects
-            system_prompt = """You are an expert at writing compelling project descriptions that highlight relevant technical skills and achievements."""
+        system_prompt = """You are an expert at writing compelling project descriptions that highlight relevant technical skills and achievements."""
 
-            prompt = f"""Optimize this project description for a {job_requirements.job_title} role:
-
-Project: {proj.name}
-Original Description: {proj.description}
-Technologies: {', '.join(proj.technologies)}
+        # Every project shares the job-specific instructions as its prompt prefix
+        instructions = f"""Optimize the project description below for a {job_requirements.job_title} role.
 
 Job Requirements:
 - Required Skills: {', '.join(job_requirements.required_skills[:8])}
@@ -305,18 +365,35 @@ Rewrite the description (2-3 sentences) to:
 1. Emphasize technologies and skills relevant to the job
 2. Include specific accomplishments or metrics
 3. Use keywords from the job description
-4. Highlight problem-solving and impact
+4. Highlight problem-solving and impact"""
+
+        prompts = [
+            f"""{instructions}
+
+Project: {proj.name}
+Original Description: {proj.description}
+Technologies: {', '.join(proj.technologies)}
 
 Return ONLY the optimized description."""
+            for proj in projects[:3]  # Focus on top 3 projects
+        ]
 
-            try:
-                optimized_desc = self.llm.generate_text(
+        results = await asyncio.gather(
+            *(
+                self.llm.agenerate_text(
                     prompt=prompt, system_prompt=system_prompt, temperature=0.6,
-                    model=settings.GENERATION_MODEL
+                    model=model_state.generation, cache=True
                 )
+                for prompt in prompts
+            ),
+            return_exceptions=True,
+        )
+
+        for proj, optimized_desc in zip(projects, results):
+            if isinstance(optimized_desc, Exception):
+                logger.warning(f"Error optimizing project: {str(optimized_desc)}")
+            else:
                 proj.description = optimized_desc.strip()
-            except Exception as e:
-                logger.warning(f"Error optimizing project: {str(e)}")
 
         return projects
 
@@ -325,26 +402,22 @@ Return ONLY the optimized description."""
     ) -> ATSAnalysis:
         """Analyze ATS compliance and keyword matching"""
 
-        # Extract all keywords from resume
-        resume_keywords = []
-        resume_keywords.extend(resume_data.skills)
-        resume_keywords.extend(
-            [exp.position for exp in resume_data.experience]
-        )
+        # Skills, positions and responsibilities, streamed into one lowercased string
+        resume_text = " ".join(chain(
+            resume_data.skills,
+            (exp.position for exp in resume_data.experience),
+            chain.from_iterable(exp.responsibilities for exp in resume_data.experience),
+        )).lower()
 
-        # Add keywords from descriptions
-        for exp in resume_data.experience:
-            resume_keywords.extend(exp.responsibilities)
-
-        resume_text = " ".join(resume_keywords).lower()
-
-        # Calculate keyword matches
+        # Calculate keyword matches (the resume text is tokenized once)
         job_keywords = job_requirements.keywords + job_requirements.required_skills
+        job_keywords_lower = [k.lower() for k in job_keywords]
+        found = set(match_keywords(job_keywords_lower, resume_text))
         matched_keywords = []
         missing_keywords = []
 
-        for keyword in job_keywords:
-            if keyword.lower() in resume_text:
+        for keyword, keyword_lower in zip(job_keywords, job_keywords_lower):
+            if keyword_lower in found:
                 matched_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
@@ -387,6 +460,7 @@ Return ONLY the optimized description."""
             suggestions=suggestions,
             format_compliance=True,
             section_coverage=section_coverage,
+            coverage_score=round(coverage_score, 2),
         )
 
     def _calculate_relevance_score(
@@ -399,9 +473,7 @@ Return ONLY the optimized description."""
 
         # Factors to consider
         keyword_score = ats_analysis.keyword_match_score
-        section_score = sum(ats_analysis.section_coverage.values()) / len(
-            ats_analysis.section_coverage
-        )
+        section_score = ats_analysis.coverage_score
 
         # Experience relevance (simple heuristic)
         experience_score = min(len(resume_data.experience) / 3, 1.0)
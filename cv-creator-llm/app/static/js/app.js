@@ -87,7 +87,12 @@ resumeFile.addEventListener('change', async (e) => {
 
         if (result.success) {
             resumeUploaded = true;
-            showStatus(resumeStatus, `✅ ${result.message}`, 'success');
+            if (result.skipped_sections && result.skipped_sections.length) {
+                // Some sections failed to extract and are empty; let the user retry or fill them in
+                showStatus(resumeStatus, `⚠️ ${result.message}`, 'warning');
+            } else {
+                showStatus(resumeStatus, `✅ ${result.message}`, 'success');
+            }
 
             // Show preview
             resumePreview.innerHTML = `
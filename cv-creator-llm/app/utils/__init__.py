@@ -1,4 +1,5 @@
 """Utilities package"""
-from .document_extractor import DocumentExtractor, extract_contact_info
+from .document_extractor import DocumentExtractor, EXTENSION_HANDLERS, extract_contact_info
+from .keywords import match_keywords
 
-__all__ = ["DocumentExtractor", "extract_contact_info"]
+__all__ = ["DocumentExtractor", "EXTENSION_HANDLERS", "extract_contact_info", "match_keywords"]
@@ -1,14 +1,130 @@
 """
 Document extraction utilities for PDF, DOCX, and TXT files
 """
-import pdfplumber
-from docx import Document
+import codecs
+import zipfile
+from charset_normalizer import from_bytes
 from typing import Dict, Any, Optional
+import os
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# pdfplumber, python-docx and lxml are imported where they are used, so that
+# importing this module (and plain-text extraction) doesn't load them
+
+# Used by clean_text. Control characters that count as whitespace are left
+# for the whitespace collapse, which turns them into spaces
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS = dict.fromkeys(
+    c for c in (*range(0x00, 0x09), *range(0x0b, 0x0d), *range(0x0e, 0x20), *range(0x7f, 0xa0))
+    if not chr(c).isspace()
+)
+
+# Byte order marks and the encodings they identify (UTF-32 before UTF-16,
+# whose little-endian BOM is a prefix of UTF-32's)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# WordprocessingML tags read by the raw-XML DOCX extractor
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY, _W_P, _W_R, _W_T = _W + 'body', _W + 'p', _W + 'r', _W + 't'
+_W_TBL, _W_TC, _W_HYPERLINK = _W + 'tbl', _W + 'tc', _W + 'hyperlink'
+_W_BR, _W_BR_TYPE = _W + 'br', _W + 'type'
+# Run elements with a fixed text equivalent (as python-docx renders them)
+_W_RUN_CHARS = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+
+
+def _docx_paragraph_text(paragraph) -> str:
+    """Text of a w:p element's runs and hyperlinks, matching python-docx's Paragraph.text"""
+    parts = []
+    for child in paragraph.iterchildren(_W_R, _W_HYPERLINK):
+        runs = child.iterchildren(_W_R) if child.tag == _W_HYPERLINK else (child,)
+        for run in runs:
+            for item in run:
+                if item.tag == _W_T:
+                    parts.append(item.text or '')
+                elif item.tag == _W_BR:
+                    # Line breaks are newlines; page and column breaks add nothing
+                    if item.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                else:
+                    parts.append(_W_RUN_CHARS.get(item.tag, ''))
+    return ''.join(parts)
+
+
+def _docx_xml_text(file_path: str) -> str:
+    """
+    Extract DOCX text by streaming word/document.xml, without python-docx's object model
+
+    Like the python-docx extraction: non-empty body paragraphs, then the text of
+    each non-empty cell of the body's tables.
+    """
+    from lxml import etree
+
+    paragraphs = []
+    cells = []
+    open_cells = []  # paragraph texts of the (possibly nested) cells being parsed
+
+    with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml:
+        events = etree.iterparse(xml, events=('start', 'end'), tag=(_W_P, _W_TC, _W_TBL))
+        for event, element in events:
+            if event == 'start':
+                if element.tag == _W_TC:
+                    open_cells.append([])
+                continue
+
+            parent = element.getparent()
+            if element.tag == _W_P:
+                if parent.tag == _W_BODY:
+                    text = _docx_paragraph_text(element)
+                    if text.strip():
+                        paragraphs.append(text)
+                elif parent.tag == _W_TC:
+                    open_cells[-1].append(_docx_paragraph_text(element))
+            elif element.tag == _W_TC:
+                cell_paragraphs = open_cells.pop()
+                if not open_cells:  # a cell of a top-level table
+                    text = '\n'.join(cell_paragraphs)
+                    if text.strip():
+                        cells.append(text)
+
+            # Free finished top-level blocks so memory stays flat
+            if parent is not None and parent.tag == _W_BODY:
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    return '\n'.join(paragraphs + cells)
+
+
+def _python_docx_text(file_path: str) -> str:
+    """Extract DOCX text with python-docx (handles packages with an unusual layout)"""
+    from docx import Document
+
+    doc = Document(file_path)
+    text = []
+
+    # Extract text from paragraphs
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            text.append(paragraph.text)
+
+    # Extract text from tables
+    for table in doc.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    text.append(cell.text)
+
+    return "\n".join(text)
+
 
 class DocumentExtractor:
     """Extract text from various document formats"""
@@ -25,22 +141,28 @@ class DocumentExtractor:
             Extracted text content
         """
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as f:
-                        text = f.read()
-                    logger.info(f"Successfully extracted {len(text)} characters from TXT using {encoding} encoding")
-                    return text.strip()
-                except UnicodeDecodeError:
-                    continue
-
-            # If all encodings fail, read as binary and decode with errors ignored
+            # One read; the encoding is taken from a BOM, else UTF-8, else detected
             with open(file_path, 'rb') as f:
-                text = f.read().decode('utf-8', errors='ignore')
-            logger.info(f"Successfully extracted {len(text)} characters from TXT (with error handling)")
+                raw = f.read()
+
+            encoding = next((enc for bom, enc in _BOMS if raw.startswith(bom)), 'utf-8')
+            try:
+                text = raw.decode(encoding)
+            except UnicodeDecodeError:
+                # Short Western text is often ambiguous between code pages;
+                # prefer Windows-1252 whenever it is a plausible candidate
+                matches = from_bytes(raw)
+                best = next((m for m in matches if m.encoding == 'cp1252'), None) or matches.best()
+                encoding = best.encoding if best else None
+                text = raw.decode(encoding) if encoding else raw.decode('utf-8', errors='ignore')
+
+            if encoding:
+                logger.info(f"Successfully extracted {len(text)} characters from TXT using {encoding} encoding")
+            else:
+                logger.info(f"Successfully extracted {len(text)} characters from TXT (with error handling)")
+
+            # Match text-mode reads, which translate \r\n and \r to \n
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
             return text.strip()
 
         except Exception as e:
@@ -58,14 +180,19 @@ class DocumentExtractor:
         Returns:
             Extracted text content
         """
+        import pdfplumber
+
         try:
-            text = ""
+            parts = []
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
                     page_text = page.extract_text()
                     if page_text:
-                        text += page_text + "\n"
+                        parts.append(page_text)
+                    # Drop the page's parsed layout so only one page is held at a time
+                    page.close()
 
+            text = "\n".join(parts)
             logger.info(f"Successfully extracted {len(text)} characters from PDF")
             return text.strip()
 
@@ -84,23 +211,16 @@ class DocumentExtractor:
         Returns:
             Extracted text content
         """
+        from lxml import etree
+
         try:
-            doc = Document(file_path)
-            text = []
-
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text.append(paragraph.text)
-
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text.append(cell.text)
-
-            extracted_text = "\n".join(text)
+            try:
+                extracted_text = _docx_xml_text(file_path)
+            except (KeyError, etree.XMLSyntaxError) as e:
+                # e.g. the main part isn't word/document.xml; python-docx follows the rels
+                logger.warning(f"Raw DOCX parsing failed ({str(e)}), using python-docx")
+                extracted_text = _python_docx_text(file_path)
+
             logger.info(f"Successfully extracted {len(extracted_text)} characters from DOCX")
             return extracted_text.strip()
 
@@ -119,16 +239,10 @@ class DocumentExtractor:
         Returns:
             Extracted text content
         """
-        file_path_lower = file_path.lower()
-
-        if file_path_lower.endswith('.pdf'):
-            return cls.extract_from_pdf(file_path)
-        elif file_path_lower.endswith('.docx') or file_path_lower.endswith('.doc'):
-            return cls.extract_from_docx(file_path)
-        elif file_path_lower.endswith('.txt'):
-            return cls.extract_from_txt(file_path)
-        else:
+        handler = EXTENSION_HANDLERS.get(os.path.splitext(file_path)[1].lower())
+        if handler is None:
             raise ValueError(f"Unsupported file format: {file_path}")
+        return handler(file_path)
 
     @staticmethod
     def clean_text(text: str) -> str:
@@ -141,11 +255,11 @@ class DocumentExtractor:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-
         # Remove special characters that might interfere with processing
-        text = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+        text = text.translate(_CONTROL_CHARS)
+
+        # Remove excessive whitespace
+        text = _WHITESPACE_RE.sub(' ', text)
 
         return text.strip()
 
@@ -164,6 +278,25 @@ class DocumentExtractor:
         return cls.clean_text(raw_text)
 
 
+# File extension -> text extractor
+EXTENSION_HANDLERS = {
+    ".pdf": DocumentExtractor.extract_from_pdf,
+    ".docx": DocumentExtractor.extract_from_docx,
+    ".doc": DocumentExtractor.extract_from_docx,
+    ".txt": DocumentExtractor.extract_from_txt,
+}
+
+
+# Contact details as one alternation of named patterns
+_CONTACT_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<linkedin>linkedin\.com/in/[\w-]+)'
+    r'|(?P<github>github\.com/[\w-]+)'
+    r'|(?P<phone>(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})',
+    re.IGNORECASE,
+)
+
+
 def extract_contact_info(text: str) -> Dict[str, Optional[str]]:
     """
     Extract contact information using regex patterns
@@ -181,28 +314,12 @@ def extract_contact_info(text: str) -> Dict[str, Optional[str]]:
         "github": None,
     }
 
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        contact_info["email"] = email_match.group()
-
-    # Phone pattern (various formats)
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_match = re.search(phone_pattern, text)
-    if phone_match:
-        contact_info["phone"] = phone_match.group()
-
-    # LinkedIn pattern
-    linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-    linkedin_match = re.search(linkedin_pattern, text, re.IGNORECASE)
-    if linkedin_match:
-        contact_info["linkedin"] = linkedin_match.group()
-
-    # GitHub pattern
-    github_pattern = r'github\.com/[\w-]+'
-    github_match = re.search(github_pattern, text, re.IGNORECASE)
-    if github_match:
-        contact_info["github"] = github_match.group()
+    # One scan over the text; the first match of each kind wins
+    for match in _CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        if contact_info[kind] is None:
+            contact_info[kind] = match.group()
+            if all(contact_info.values()):
+                break
 
     return contact_info
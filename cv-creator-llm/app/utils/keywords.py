@@ -0,0 +1,28 @@
+"""
+Keyword matching utilities
+"""
+import re
+from typing import List
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def match_keywords(keywords: List[str], text: str) -> List[str]:
+    """
+    Return the keywords found in text
+
+    Single-word keywords are checked against a token set built in one pass;
+    phrases and keywords with punctuation (e.g. "c++") fall back to substring search.
+
+    Args:
+        keywords: Keywords to look for, in the same case as text
+        text: Text to search
+
+    Returns:
+        The keywords that occur in text, in their original order
+    """
+    tokens = set(_WORD_RE.findall(text))
+    return [
+        kw for kw in keywords
+        if (kw in tokens if _WORD_RE.fullmatch(kw) else kw in text)
+    ]
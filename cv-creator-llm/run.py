@@ -45,7 +45,8 @@ def main():
     print("📚 API docs at: http://localhost:8000/docs")
     print("\nPress Ctrl+C to stop\n")
 
-    # Start uvicorn
+    # Start uvicorn (its "auto" loop/http pick uvloop and httptools where installed;
+    # uvloop is not available on Windows)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
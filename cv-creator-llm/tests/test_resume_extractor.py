@@ -0,0 +1,41 @@
+"""
+Tests for resume text budgeting in the resume extractor
+"""
+import unittest
+
+from app.services.resume_extractor import _estimate_tokens, _fit_to_token_budget
+from app.utils.document_extractor import DocumentExtractor
+
+
+class FitToTokenBudgetTest(unittest.TestCase):
+    """_fit_to_token_budget on text as the upload path produces it"""
+
+    def setUp(self):
+        raw = "\n".join(
+            f"Senior Engineer {i}\n- Built distributed systems in Python\n- Led a team of engineers"
+            for i in range(200)
+        )
+        # Uploads are cleaned before extraction, which collapses every newline
+        self.text = DocumentExtractor.clean_text(raw)
+        self.words = set(self.text.split())
+
+    def test_short_text_is_unchanged(self):
+        self.assertEqual(_fit_to_token_budget(self.text, _estimate_tokens(self.text)), self.text)
+
+    def test_cleaned_text_is_cut_between_words(self):
+        # Several budgets, so the raw cut points land inside words
+        for max_tokens in range(200, 220):
+            with self.subTest(max_tokens=max_tokens):
+                fitted = _fit_to_token_budget(self.text, max_tokens)
+
+                head, tail = fitted.split("\n...\n")
+                self.assertTrue(self.text.startswith(head))
+                self.assertTrue(self.text.endswith(tail))
+                # Every kept word is whole: no word was split at either cut
+                for word in head.split() + tail.split():
+                    self.assertIn(word, self.words)
+                self.assertLessEqual(_estimate_tokens(head + tail), max_tokens)
+
+
+if __name__ == "__main__":
+    unittest.main()